@@ -1,95 +1,555 @@
 from __future__ import annotations
 
-from typing import Dict, List, Sequence, Tuple
+import time
+import tracemalloc
+from itertools import repeat
+from operator import itemgetter
+from typing import Callable, Dict, List, Sequence, Tuple
 
+from best_fit_index import BestFitIndex
+from schedule import Schedule
+from skyline import Skyline, SkylinePlacement
 from tournament_tree import TournamentTree
 
 Task = Tuple[int, int]  # (r_j, t_j)
-Level = Dict[str, object]
-Schedule = List[Level]
+
+
+# Counting sort is used while key range * COUNTING_RANGE_DIVISOR <= m.
+# bench_sort.py (best of 7): m = 1e5, range 100: 0.018 s vs 0.020 s Timsort;
+# m = 1e6, range 1000: 0.26 s vs 0.30 s; m = 1e6, range 1e4: 0.39 s vs
+# 0.33 s, so the crossover sits near m / 250. Above it Timsort on
+# itemgetter beats Python-level radix passes and the list -> ndarray round
+# trip of argsort_tasks.
+COUNTING_RANGE_DIVISOR = 250
+RADIX_BITS = 11
+FILL_MIN_RUN = 8  # equal-width runs from this length on go through TournamentTree.fill
 
 
 def counting_sort(tasks: Sequence[Task]) -> List[Task]:
-    """Sort tasks by t_j descending using counting sort when possible."""
+    """Sort tasks by t_j descending using counting sort over [min t_j, max t_j]."""
     if not tasks:
         return []
 
-    if any(t < 0 for _, t in tasks):
-        return sorted(tasks, key=lambda x: x[1], reverse=True)
+    heights = list(map(itemgetter(1), tasks))
+    max_t = max(heights)
+    counts: List[List[Task]] = [[] for _ in range(max_t - min(heights) + 1)]
+    appends = [bucket.append for bucket in counts]
+    for task, t in zip(tasks, heights):
+        appends[max_t - t](task)
+
+    result: List[Task] = []
+    for bucket in counts:
+        result.extend(bucket)
+    return result
+
+
+def radix_sort(tasks: Sequence[Task], *, bits: int = RADIX_BITS) -> List[Task]:
+    """Stable LSD radix sort of integer t_j descending, `bits` key bits per pass."""
+    if not tasks:
+        return []
 
     max_t = max(t for _, t in tasks)
-    counts: List[List[Task]] = [[] for _ in range(max_t + 1)]
-    for r, t in tasks:
-        counts[t].append((r, t))
+    span = max_t - min(t for _, t in tasks)
+    mask = (1 << bits) - 1
 
-    result: List[Task] = []
-    for t in range(max_t, -1, -1):
-        result.extend(counts[t])
+    # Ascending order of (max_t - t_j) is descending order of t_j.
+    result = list(tasks)
+    shift = 0
+    while span >> shift:
+        buckets: List[List[Task]] = [[] for _ in range(mask + 1)]
+        for task in result:
+            buckets[((max_t - task[1]) >> shift) & mask].append(task)
+        result = [task for bucket in buckets for task in bucket]
+        shift += bits
     return result
 
 
-def _make_level(level_height: int, capacity: int) -> Level:
-    return {
-        "height": level_height,
-        "remaining": capacity,
-        "tasks": [],
-    }
+def argsort_tasks(tasks: Sequence[Task]) -> List[Task]:
+    """Stable NumPy argsort by t_j descending; accepts integer and float t_j."""
+    import numpy as np
 
+    if not tasks:
+        return []
 
-def _total_time(schedule: Schedule) -> int:
-    return sum(int(level["height"]) for level in schedule)
+    tasks = list(tasks)
+    keys = np.array([t for _, t in tasks])
+    if keys.dtype.kind not in "iuf":
+        keys = keys.astype(np.float64)
+    order = np.argsort(-keys, kind="stable")
+    return [tasks[i] for i in order.tolist()]
 
 
-def nfdh(tasks: Sequence[Task], n: int) -> Tuple[Schedule, int]:
-    """Next Fit Decreasing Height."""
+def _timsort(tasks: Sequence[Task]) -> List[Task]:
+    return sorted(tasks, key=itemgetter(1), reverse=True)
+
+
+SORT_STRATEGIES = {
+    "counting": counting_sort,
+    "radix": radix_sort,
+    "numpy": argsort_tasks,
+    "timsort": _timsort,
+}
+
+
+def choose_sort_strategy(m: int, key_range: int | None) -> str:
+    """
+    Pick a sort for m tasks whose integer t_j span key_range values
+    (None for float t_j). Returns a key of SORT_STRATEGIES.
+    """
+    if key_range is not None and key_range * COUNTING_RANGE_DIVISOR <= m:
+        return "counting"
+    return "timsort"
+
+
+def _sort_by_height(tasks: Sequence[Task], strategy: str | None = None) -> Tuple[List[Task], bool]:
+    """Adaptive descending sort by t_j. Also reports whether all t_j are integers."""
+    if not tasks:
+        return [], True
+
+    heights = [t for _, t in tasks]
+    integral = all(isinstance(t, int) for t in heights)
+    if strategy is None:
+        key_range = max(heights) - min(heights) + 1 if integral else None
+        strategy = choose_sort_strategy(len(heights), key_range)
+    elif strategy not in SORT_STRATEGIES:
+        raise ValueError(f"Unknown sort strategy: {strategy}")
+    if not integral and strategy in ("counting", "radix"):
+        raise ValueError(f"Sort strategy {strategy} requires integer t_j")
+
+    return SORT_STRATEGIES[strategy](tasks), integral
+
+
+def sort_tasks(tasks: Sequence[Task], *, strategy: str | None = None) -> List[Task]:
+    """
+    Stable sort of tasks by t_j descending. The strategy is chosen from m and
+    the key range unless given explicitly.
+    """
+    return _sort_by_height(tasks, strategy)[0]
+
+
+class PackStats:
+    """
+    Per-phase profile of one packing run, filled by `instrumented`.
+
+    phases: wall time in seconds of "sort", "pack", "tree" (inside level
+    index calls, part of "pack"), "levels" (pack minus tree: placing tasks
+    and opening levels) and "total".
+    tree_ops: calls per level index operation (query/update/append/fill for
+    FFDH's TournamentTree, pop_best/insert for BFDH's BestFitIndex).
+    tree_time: seconds spent inside those calls so far (the "tree" phase).
+    peak_memory: tracemalloc peak in bytes above the starting point, or None.
+
+    Timers wrap every index call, so instrumented runs are slower than plain
+    ones (more so with trace_memory); compare phases with each other, not
+    with uninstrumented runtimes.
+    """
+
+    def __init__(self, algorithm: str, m: int, n: int) -> None:
+        self.algorithm = algorithm
+        self.m = m
+        self.n = n
+        self.phases: Dict[str, float] = {}
+        self.tree_ops: Dict[str, int] = {}
+        self.levels_opened = 0
+        self.peak_memory: int | None = None
+        self.tree_time = 0.0
+
+    def timed(self, name: str, func: Callable[..., int]) -> Callable[..., int]:
+        """Wrap a level index method so its calls are counted and timed."""
+        counts = self.tree_ops
+        counts.setdefault(name, 0)
+        clock = time.perf_counter
+
+        def wrapper(*args: int) -> int:
+            t0 = clock()
+            result = func(*args)
+            self.tree_time += clock() - t0
+            counts[name] += 1
+            return result
+
+        return wrapper
+
+    def report(self) -> str:
+        lines = [f"stats: algorithm={self.algorithm}, m={self.m}, n={self.n}, levels_opened={self.levels_opened}"]
+        for phase, seconds in self.phases.items():
+            lines.append(f"  phase {phase}: {seconds:.6f}s")
+        for name, count in self.tree_ops.items():
+            lines.append(f"  tree {name}: {count}")
+        if self.peak_memory is not None:
+            lines.append(f"  peak_memory: {self.peak_memory} bytes")
+        return "\n".join(lines)
+
+
+Packer = Callable[..., Tuple[Schedule, int]]
+
+# Packing engines on pre-sorted input, by name. Shared preprocessing
+# (pipeline.PreparedTasks) runs any of them on one sorted task set.
+PACKERS: Dict[str, Packer] = {}
+
+
+def register_packer(name: str) -> Callable[[Packer], Packer]:
+    """
+    Register fn(sorted_tasks, n, *, integral, stats=None) -> (schedule, T(S))
+    under name. A packer given a PackStats wraps its level index calls with
+    stats.timed; with stats=None it must run the plain loop.
+    """
+
+    def decorator(func: Packer) -> Packer:
+        PACKERS[name.upper()] = func
+        return func
+
+    return decorator
+
+
+@register_packer("NFDH")
+def pack_nfdh(
+    sorted_tasks: Sequence[Task],
+    n: int,
+    *,
+    integral: bool = True,
+    stats: PackStats | None = None,
+) -> Tuple[Schedule, int]:
+    """Next Fit Decreasing Height over tasks already sorted by t_j descending."""
     if n <= 0:
         raise ValueError("n must be positive")
 
-    sorted_tasks = counting_sort(tasks)
-    schedule: Schedule = []
+    schedule = Schedule(n, height_code="q" if integral else "d")
+
+    # Hot loop works on bound array methods; only the open level's free width
+    # is kept in a local and flushed to the schedule when the level closes.
+    heights = schedule.heights
+    level_remaining = schedule.remaining
+    task_level = schedule.task_level.append
+    task_offset = schedule.task_offset.append
+    task_width = schedule.task_width.append
+    task_height = schedule.task_height.append
 
-    current_level = None
+    level = -1
+    remaining = -1
     for r, t in sorted_tasks:
         if r > n:
             raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
 
-        if current_level is None or int(current_level["remaining"]) < r:
-            current_level = _make_level(level_height=t, capacity=n)
-            schedule.append(current_level)
+        if remaining < r:
+            if level >= 0:
+                level_remaining[level] = remaining
+            level = schedule.open_level(t)
+            remaining = n
 
-        current_level["tasks"].append((r, t))
-        current_level["remaining"] = int(current_level["remaining"]) - r
+        task_level(level)
+        task_offset(n - remaining)
+        task_width(r)
+        task_height(t)
+        remaining -= r
 
-    return schedule, _total_time(schedule)
+    if level >= 0:
+        level_remaining[level] = remaining
 
+    return schedule, sum(heights)
 
-def ffdh(tasks: Sequence[Task], n: int) -> Tuple[Schedule, int]:
-    """First Fit Decreasing Height with TournamentTree."""
+
+def _fill_run(
+    schedule: Schedule,
+    sorted_tasks: Sequence[Task],
+    start: int,
+    end: int,
+    fill: Callable[[int, int], Tuple[List[Tuple[int, int]], int]],
+    append: Callable[[int], int],
+) -> int:
+    """Place tasks[start:end] (all of one width) First-Fit via TournamentTree.fill; returns the last level used."""
+    n = schedule.n
+    r = sorted_tasks[start][0]
+    level_remaining = schedule.remaining
+    count = end - start
+    pos = start
+    while True:
+        placed, count = fill(r, count)
+        for idx, k in placed:
+            free = level_remaining[idx]
+            schedule.task_level.extend(repeat(idx, k))
+            schedule.task_offset.extend(range(n - free, n - free + k * r, r) if r else repeat(n - free, k))
+            schedule.task_width.extend(repeat(r, k))
+            schedule.task_height.extend(map(itemgetter(1), sorted_tasks[pos : pos + k]))
+            level_remaining[idx] = free - k * r
+            pos += k
+            last_idx = idx
+        if not count:
+            return last_idx
+        append(n)
+        schedule.open_level(sorted_tasks[pos][1])
+
+
+@register_packer("FFDH")
+def pack_ffdh(
+    sorted_tasks: Sequence[Task],
+    n: int,
+    *,
+    integral: bool = True,
+    stats: PackStats | None = None,
+) -> Tuple[Schedule, int]:
+    """First Fit Decreasing Height with TournamentTree over tasks already sorted by t_j descending."""
     if n <= 0:
         raise ValueError("n must be positive")
 
-    sorted_tasks = counting_sort(tasks)
+    schedule = Schedule(n, height_code="q" if integral else "d")
     if not sorted_tasks:
-        return [], 0
+        return schedule, 0
+
+    tree = TournamentTree()
+    query = tree.query
+    update = tree.update
+    append = tree.append
+    fill = tree.fill
+    if stats is not None:
+        query = stats.timed("query", query)
+        update = stats.timed("update", update)
+        append = stats.timed("append", append)
+        fill = stats.timed("fill", fill)
+    heights = schedule.heights
+    level_remaining = schedule.remaining
+    task_level = schedule.task_level.append
+    task_offset = schedule.task_offset.append
+    task_width = schedule.task_width.append
+    task_height = schedule.task_height.append
+
+    # Levels before the last used one had free width < last_r when it was
+    # chosen, so for r >= last_r that level is still the first fit as long
+    # as it has room. Such tasks skip the query, and the tree update for the
+    # level is deferred until the next tree call. When a query is needed for
+    # a run of at least FILL_MIN_RUN equal widths, TournamentTree.fill places
+    # the whole run with one query and update per level.
+    m = len(sorted_tasks)
+    last_idx = -1
+    last_r = 0
+    skip = 0
+    for i, (r, t) in enumerate(sorted_tasks):
+        if i < skip:
+            continue
+        if r > n:
+            raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
+
+        if r >= last_r and last_idx >= 0 and level_remaining[last_idx] >= r:
+            idx = last_idx
+        else:
+            if last_idx >= 0:
+                update(last_idx, level_remaining[last_idx])
+            end = i + 1
+            while end < m and sorted_tasks[end][0] == r:
+                end += 1
+            if end - i >= FILL_MIN_RUN:
+                last_idx = _fill_run(schedule, sorted_tasks, i, end, fill, append)
+                last_r = r
+                skip = end
+                continue
+            idx = query(r)
+            if idx == -1:
+                idx = append(n)
+                schedule.open_level(t)
 
-    schedule: Schedule = []
-    tree = TournamentTree(size=len(sorted_tasks))
+        free = level_remaining[idx]
+        task_level(idx)
+        task_offset(n - free)
+        task_width(r)
+        task_height(t)
+        level_remaining[idx] = free - r
+        last_idx = idx
+        last_r = r
+
+    return schedule, sum(heights)
+
+
+@register_packer("BFDH")
+def pack_bfdh(
+    sorted_tasks: Sequence[Task],
+    n: int,
+    *,
+    integral: bool = True,
+    stats: PackStats | None = None,
+) -> Tuple[Schedule, int]:
+    """Best Fit Decreasing Height with BestFitIndex over remaining widths over tasks already sorted by t_j descending."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    schedule = Schedule(n, height_code="q" if integral else "d")
+    if not sorted_tasks:
+        return schedule, 0
+
+    index = BestFitIndex(capacity=n)
+    pop_best = index.pop_best
+    insert = index.insert
+    if stats is not None:
+        pop_best = stats.timed("pop_best", pop_best)
+        insert = stats.timed("insert", insert)
+    heights = schedule.heights
+    level_remaining = schedule.remaining
+    task_level = schedule.task_level.append
+    task_offset = schedule.task_offset.append
+    task_width = schedule.task_width.append
+    task_height = schedule.task_height.append
 
     for r, t in sorted_tasks:
         if r > n:
             raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
 
-        idx = tree.query(r)
+        idx = pop_best(r)
         if idx == -1:
-            idx = len(schedule)
-            level = _make_level(level_height=t, capacity=n)
-            schedule.append(level)
-        else:
-            level = schedule[idx]
+            idx = schedule.open_level(t)
+
+        free = level_remaining[idx]
+        task_level(idx)
+        task_offset(n - free)
+        task_width(r)
+        task_height(t)
+        free -= r
+        level_remaining[idx] = free
+        insert(idx, free)
+
+    return schedule, sum(heights)
+
+
+@register_packer("SKYLINE")
+def pack_skyline(
+    sorted_tasks: Sequence[Task],
+    n: int,
+    *,
+    integral: bool = True,
+    stats: PackStats | None = None,
+) -> Tuple[SkylinePlacement, int]:
+    """
+    Bottom-left skyline packing (not level-based) over tasks already sorted
+    by t_j descending. Repeatedly takes the lowest, leftmost skyline gap and
+    puts at its left end the widest remaining task that fits (the tallest
+    among equally wide ones); if none fits, the gap is raised to its lower
+    neighbour. Every step places a task or removes a segment in O(log m),
+    plus one O(K) key-list shift when the last task of one of the K
+    distinct widths is taken: O(m log m + K^2) overall, independent of n.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    code = "q" if integral else "d"
+    placement = SkylinePlacement(n, height_code=code)
+    if not sorted_tasks:
+        return placement, 0
+
+    # Keyed by n - r_j: BestFitIndex's smallest key >= n - w is the widest
+    # task with r_j <= w, and its per-key heap yields the lowest index, i.e.
+    # the tallest such task. Only the distinct task widths are stored.
+    for r, _ in sorted_tasks:
+        if r > n:
+            raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
+    index = BestFitIndex.from_items(n, ((idx, n - r) for idx, (r, _) in enumerate(sorted_tasks)))
+
+    skyline = Skyline(n, height_code=code)
+    pop_best = index.pop_best
+    if stats is not None:
+        pop_best = stats.timed("pop_best", pop_best)
+    lowest = skyline.lowest
+    place = skyline.place
+    raise_gap = skyline.raise_gap
+    gap_width = skyline.seg_w
+    task_x = placement.task_x.append
+    task_start = placement.task_start.append
+    task_width = placement.task_width.append
+    task_height = placement.task_height.append
+
+    makespan = 0
+    left = len(sorted_tasks)
+    while left:
+        seg = lowest()
+        idx = pop_best(n - gap_width[seg])
+        if idx == -1:
+            raise_gap(seg)
+            continue
+
+        r, t = sorted_tasks[idx]
+        x, start = place(seg, r, t)
+        task_x(x)
+        task_start(start)
+        task_width(r)
+        task_height(t)
+        if start + t > makespan:
+            makespan = start + t
+        left -= 1
+
+    return placement, makespan
+
+
+def nfdh(tasks: Sequence[Task], n: int) -> Tuple[Schedule, int]:
+    """Next Fit Decreasing Height."""
+    sorted_tasks, integral = _sort_by_height(tasks)
+    return pack_nfdh(sorted_tasks, n, integral=integral)
+
+
+def ffdh(tasks: Sequence[Task], n: int) -> Tuple[Schedule, int]:
+    """First Fit Decreasing Height with TournamentTree."""
+    sorted_tasks, integral = _sort_by_height(tasks)
+    return pack_ffdh(sorted_tasks, n, integral=integral)
+
+
+def bfdh(tasks: Sequence[Task], n: int) -> Tuple[Schedule, int]:
+    """Best Fit Decreasing Height with BestFitIndex over remaining widths."""
+    sorted_tasks, integral = _sort_by_height(tasks)
+    return pack_bfdh(sorted_tasks, n, integral=integral)
+
+
+def instrumented(
+    algorithm: str,
+    tasks: Sequence[Task],
+    n: int,
+    *,
+    trace_memory: bool = True,
+) -> Tuple[Schedule, int, PackStats]:
+    """
+    Sort and pack with PACKERS[algorithm], returning a PackStats profile
+    alongside the schedule. The plain functions never touch PackStats, so
+    profiling costs nothing unless it is asked for.
+    """
+    key = algorithm.upper()
+    if key not in PACKERS:
+        raise ValueError(f"Unknown algorithm {algorithm}; registered: {', '.join(PACKERS)}")
+    stats = PackStats(key, len(tasks), n)
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    if trace_memory:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+    clock = time.perf_counter
+    try:
+        t0 = clock()
+        sorted_tasks, integral = _sort_by_height(tasks)
+        t1 = clock()
+        schedule, t_s = PACKERS[key](sorted_tasks, n, integral=integral, stats=stats)
+        t2 = clock()
+        if trace_memory:
+            stats.peak_memory = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    tree = stats.tree_time
+    stats.phases = {
+        "sort": t1 - t0,
+        "pack": t2 - t1,
+        "tree": tree,
+        "levels": t2 - t1 - tree,
+        "total": t2 - t0,
+    }
+    stats.levels_opened = len(getattr(schedule, "heights", ()))  # skyline has no levels
+    return schedule, t_s, stats
+
+
+def skyline(tasks: Sequence[Task], n: int) -> Tuple[SkylinePlacement, int]:
+    """Bottom-left skyline packing; returns per-task start times instead of levels."""
+    sorted_tasks, integral = _sort_by_height(tasks)
+    return pack_skyline(sorted_tasks, n, integral=integral)
 
-        level["tasks"].append((r, t))
-        new_remaining = int(level["remaining"]) - r
-        level["remaining"] = new_remaining
-        tree.update(idx, new_remaining)
 
-    return schedule, _total_time(schedule)
+ALGORITHMS = {
+    "NFDH": nfdh,
+    "FFDH": ffdh,
+    "BFDH": bfdh,
+    "SKYLINE": skyline,
+}
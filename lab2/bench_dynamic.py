@@ -0,0 +1,90 @@
+"""Live queue benchmark: DynamicSchedule updates vs full FFDH recomputation.
+
+Usage:
+  python bench_dynamic.py
+  python bench_dynamic.py --m 1000 10000 100000 --n 1024 --ops 20000
+
+Starts from m random tasks, then applies `ops` operations, each adding a
+new task or cancelling a random live one with equal probability. Reports
+the mean time per operation for the incremental structure and for a full
+ffdh() rerun after a change (sampled on `recompute_samples` operations),
+and the makespan of both at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Sequence
+
+from algorithms import ffdh
+from data_handler import generate_random_tasks
+from dynamic_schedule import DynamicSchedule
+
+
+def run_case(m: int, n: int, ops: int, recompute_samples: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    schedule = DynamicSchedule(n)
+    live: List[int] = [schedule.add(task) for task in generate_random_tasks(m, n, seed=seed)]
+
+    t0 = time.perf_counter()
+    for _ in range(ops):
+        if live and rng.random() < 0.5:
+            pos = rng.randrange(len(live))
+            live[pos], live[-1] = live[-1], live[pos]
+            schedule.remove(live.pop())
+        else:
+            live.append(schedule.add((rng.randint(1, n), rng.randint(1, 100))))
+        schedule.makespan()
+    incremental = (time.perf_counter() - t0) / ops
+
+    tasks = list(schedule.tasks().values())
+    recompute = float("inf")
+    if tasks:
+        samples = []
+        for _ in range(recompute_samples):
+            t0 = time.perf_counter()
+            ffdh(tasks, n)
+            samples.append(time.perf_counter() - t0)
+        recompute = sum(samples) / len(samples)
+        full_makespan = ffdh(tasks, n)[1]
+    else:
+        full_makespan = 0
+
+    return {
+        "incremental": incremental,
+        "recompute": recompute,
+        "makespan": schedule.makespan(),
+        "full_makespan": full_makespan,
+    }
+
+
+def run(m_values: Sequence[int], n: int, ops: int, recompute_samples: int, seed: int) -> None:
+    print(f"{'m':>9} {'inc us/op':>10} {'full us/op':>12} {'speedup':>9} {'T(S) inc':>10} {'T(S) full':>10} {'ratio':>6}")
+    for m in m_values:
+        result = run_case(m, n, ops, recompute_samples, seed + m)
+        speedup = result["recompute"] / result["incremental"]
+        ratio = result["makespan"] / result["full_makespan"] if result["full_makespan"] else float("nan")
+        print(
+            f"{m:>9} {result['incremental'] * 1e6:10.2f} {result['recompute'] * 1e6:12.1f} {speedup:9.0f} "
+            f"{result['makespan']:>10} {result['full_makespan']:>10} {ratio:6.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark incremental schedule updates against full FFDH.")
+    parser.add_argument("--m", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--n", type=int, default=1024)
+    parser.add_argument("--ops", type=int, default=10_000)
+    parser.add_argument("--recompute-samples", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+    if args.ops <= 0 or args.recompute_samples <= 0:
+        parser.error("--ops and --recompute-samples must be positive")
+
+    run(args.m, args.n, args.ops, args.recompute_samples, args.seed)
+
+
+if __name__ == "__main__":
+    main()
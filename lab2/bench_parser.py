@@ -0,0 +1,158 @@
+"""Throughput of the SWF parsers in MB/s: line-by-line Python vs mmap + NumPy blocks.
+
+Usage:
+  python bench_parser.py                       # synthetic 200 MB trace
+  python bench_parser.py --input data/LLNL-UBGL-2006-2.swf
+  python bench_parser.py --jobs 1 2 4 8 --compress gz xz
+
+Also reports the parse time of the block parser with each --jobs process
+count and of compressed copies of the trace (--compress), checking that
+every variant returns the same columns.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+import numpy as np
+
+from data_handler import parse_llnl_logs
+from swf_parser import BLOCK_SIZE, read_swf_columns
+
+
+def write_synthetic_swf(path: Path, size_mb: float, *, seed: int = 0) -> None:
+    """Write an 18-field SWF trace of roughly size_mb megabytes with a header."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1_000_000)
+    written = 0
+    submit = 0
+    job = 0
+    with path.open("w", encoding="ascii") as file:
+        header = "; Version: 2.2\n; Computer: synthetic\n; MaxProcs: 2048\n"
+        file.write(header)
+        written += len(header)
+        while written < target:
+            lines = []
+            for _ in range(10_000):
+                job += 1
+                submit += rng.randint(0, 120)
+                procs = rng.choice((32, 64, 128, 256, 512, 1024, 2048))
+                runtime = rng.randint(-1, 86_400)
+                requested = rng.choice((-1, procs))
+                lines.append(
+                    f"{job} {submit} {rng.randint(0, 5000)} {runtime} {procs} -1 -1 {requested} "
+                    f"{runtime + 60} -1 1 {rng.randint(1, 300)} -1 1 1 -1 -1 -1\n"
+                )
+            chunk = "".join(lines)
+            file.write(chunk)
+            written += len(chunk)
+
+
+def _measure(func: Callable[[], int], size_bytes: int, repeats: int) -> tuple[float, int]:
+    best = float("inf")
+    jobs = 0
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        jobs = func()
+        best = min(best, time.perf_counter() - t0)
+    return size_bytes / 1e6 / best, jobs
+
+
+def compress_copy(path: Path, codec: str, directory: Path) -> Path:
+    """Write path compressed with gz, xz or bz2 into directory."""
+    if codec == "gz":
+        import gzip as module
+    elif codec == "xz":
+        import lzma as module
+    else:
+        import bz2 as module
+    target = directory / f"{path.name}.{codec}"
+    with path.open("rb") as src, module.open(target, "wb") as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    return target
+
+
+def _timed_columns(path: Path, block_size: int, jobs: int, repeats: int) -> tuple[float, Dict[str, np.ndarray]]:
+    best = float("inf")
+    columns: Dict[str, np.ndarray] = {}
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        columns = read_swf_columns(path, block_size=block_size, jobs=jobs)
+        best = min(best, time.perf_counter() - t0)
+    return best, columns
+
+
+def run_parallel(path: Path, repeats: int, block_size: int, jobs_values: Sequence[int], codecs: Sequence[str]) -> None:
+    size = path.stat().st_size
+    print(f"block parser parse time ({os.cpu_count()} cores available, block {block_size >> 20} MB):")
+    reference = None
+    base = None
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [("plain", path)]
+        for codec in codecs:
+            variants.append((codec, compress_copy(path, codec, Path(tmp))))
+        for name, source in variants:
+            for jobs in jobs_values:
+                seconds, columns = _timed_columns(source, block_size, jobs, repeats)
+                if reference is None:
+                    reference, base = columns, seconds
+                elif any(not np.array_equal(reference[key], columns[key]) for key in reference):
+                    raise RuntimeError(f"{name} with jobs={jobs} disagrees with the sequential parser")
+                print(
+                    f"  {name:5s} jobs={jobs:<3d} {seconds:7.3f} s  {size / 1e6 / seconds:8.1f} MB/s"
+                    f"  (x{base / seconds:.2f})"
+                )
+
+
+def run(path: Path, repeats: int, block_size: int) -> None:
+    size = path.stat().st_size
+    print(f"file: {path} ({size / 1e6:.1f} MB)")
+
+    python_rate, python_jobs = _measure(lambda: len(parse_llnl_logs(path, 1 << 62)), size, repeats)
+    numpy_rate, numpy_jobs = _measure(
+        lambda: len(read_swf_columns(path, block_size=block_size)["width"]), size, repeats
+    )
+    if python_jobs != numpy_jobs:
+        raise RuntimeError(f"Parsers disagree: {python_jobs} vs {numpy_jobs} jobs")
+
+    print(f"jobs: {numpy_jobs}")
+    print(f"python line parser: {python_rate:8.1f} MB/s")
+    print(f"mmap + numpy:       {numpy_rate:8.1f} MB/s  (x{numpy_rate / python_rate:.1f})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SWF parsing throughput.")
+    parser.add_argument("--input", type=Path, default=None, help="SWF trace; synthetic if omitted.")
+    parser.add_argument("--size-mb", type=float, default=200.0, help="Size of the synthetic trace.")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--block-size", type=int, default=BLOCK_SIZE)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, 8], help="Parser process counts.")
+    parser.add_argument(
+        "--compress",
+        nargs="*",
+        choices=("gz", "xz", "bz2"),
+        default=["gz"],
+        help="Also time compressed copies of the trace.",
+    )
+    args = parser.parse_args()
+    if any(jobs <= 0 for jobs in args.jobs):
+        parser.error("--jobs values must be positive")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.input
+        if path is None:
+            path = Path(tmp) / "synthetic.swf"
+            write_synthetic_swf(path, args.size_mb)
+        run(path, args.repeats, args.block_size)
+        run_parallel(path, args.repeats, args.block_size, args.jobs, args.compress)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of the sorting stage: where counting/radix/NumPy/Timsort win.
+
+Usage:
+  python bench_sort.py
+  python bench_sort.py --m 10000 100000 --ranges 100 100000 10000000 --repeats 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List, Sequence
+
+from algorithms import SORT_STRATEGIES as STRATEGIES
+from algorithms import Task, choose_sort_strategy
+
+# Counting sort allocates one list per key; skip it when that is absurd.
+MAX_COUNTING_RANGE = 20_000_000
+
+
+def _best_time(func: Callable[[Sequence[Task]], List[Task]], tasks: Sequence[Task], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        func(tasks)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run(m_values: Sequence[int], ranges: Sequence[int], repeats: int, floats: bool) -> None:
+    names = list(STRATEGIES)
+    print(f"{'m':>9} {'range':>10} " + " ".join(f"{name:>10}" for name in names) + "  chosen")
+    for m in m_values:
+        for key_range in ranges:
+            rng = random.Random(m * 31 + key_range)
+            if floats:
+                tasks = [(1, rng.uniform(0, key_range)) for _ in range(m)]
+            else:
+                tasks = [(1, rng.randint(1, key_range)) for _ in range(m)]
+
+            cells = []
+            for name in names:
+                if floats and name in ("counting", "radix"):
+                    cells.append(f"{'-':>10}")
+                    continue
+                if name == "counting" and key_range > MAX_COUNTING_RANGE:
+                    cells.append(f"{'-':>10}")
+                    continue
+                cells.append(f"{_best_time(STRATEGIES[name], tasks, repeats):10.4f}")
+
+            chosen = choose_sort_strategy(m, None if floats else key_range)
+            print(f"{m:>9} {key_range:>10} " + " ".join(cells) + f"  {chosen}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sort strategies for the packing stage.")
+    parser.add_argument("--m", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--ranges", type=int, nargs="+", default=[100, 10_000, 100_000, 1_000_000, 100_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--floats", action="store_true", help="Use float t_j (counting/radix skipped).")
+    args = parser.parse_args()
+
+    print("Best time in seconds per strategy")
+    run(args.m, args.ranges, args.repeats, args.floats)
+
+
+if __name__ == "__main__":
+    main()
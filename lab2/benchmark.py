@@ -0,0 +1,203 @@
+"""Benchmark suite for the lab 2 packing engines with JSON baselines.
+
+Usage:
+  python benchmark.py run --out bench/current.json
+  python benchmark.py run --m 1000 100000 10000000 --n 1024 10000000 --repeats 7
+  python benchmark.py compare bench/baseline.json bench/current.json --threshold 0.10
+
+Every measurement does `warmup` untimed calls, then `repeats` timed calls
+with the garbage collector disabled, and reports median, min and IQR.
+`compare` exits with status 1 if any median regressed by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from algorithms import counting_sort, ffdh, nfdh, sort_tasks
+from data_handler import generate_random_tasks
+from tournament_tree import TournamentTree
+
+Task = Tuple[int, int]  # (r_j, t_j)
+Result = Dict[str, object]
+
+DEFAULT_M = [1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_N = [1024, 4096]
+
+
+def _tree_workload(tasks: Sequence[Task], n: int) -> Callable[[], object]:
+    """First-Fit level search as FFDH does it, without the sort and the schedule."""
+    widths = [r for r, _ in tasks]
+
+    def run() -> int:
+        tree = TournamentTree()
+        for r in widths:
+            idx = tree.query(r)
+            if idx == -1:
+                idx = tree.append(n)
+            tree.update(idx, tree.value(idx) - r)
+        return tree.size
+
+    return run
+
+
+# target name -> factory(tasks, n) returning the zero-argument call to time
+TARGETS: Dict[str, Callable[[Sequence[Task], int], Callable[[], object]]] = {
+    "nfdh": lambda tasks, n: lambda: nfdh(tasks, n),
+    "ffdh": lambda tasks, n: lambda: ffdh(tasks, n),
+    "counting_sort": lambda tasks, n: lambda: counting_sort(tasks),
+    "sort_tasks": lambda tasks, n: lambda: sort_tasks(tasks),
+    "tournament_tree": _tree_workload,
+}
+
+
+def measure(func: Callable[[], object], *, repeats: int, warmup: int) -> Dict[str, object]:
+    """Time func() `repeats` times after `warmup` calls, GC disabled while timing."""
+    if repeats <= 0:
+        raise ValueError("repeats must be positive")
+
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            gc.collect()
+            gc.disable()
+            t0 = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - t0)
+            gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+        else:
+            gc.disable()
+
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = q3 = samples[0]
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "iqr": q3 - q1,
+        "samples": samples,
+    }
+
+
+def run_suite(
+    targets: Sequence[str],
+    m_values: Sequence[int],
+    n_values: Sequence[int],
+    *,
+    repeats: int,
+    warmup: int,
+    seed: int,
+) -> List[Result]:
+    results: List[Result] = []
+    for n in n_values:
+        for m in m_values:
+            tasks = generate_random_tasks(m, n, seed=seed + m + n)
+            for target in targets:
+                stats = measure(TARGETS[target](tasks, n), repeats=repeats, warmup=warmup)
+                results.append({"target": target, "m": m, "n": n, **stats})
+                print(
+                    f"{target:>16} m={m:<9} n={n:<9} median={stats['median']:.6f}s "
+                    f"min={stats['min']:.6f}s iqr={stats['iqr']:.6f}s",
+                    flush=True,
+                )
+            del tasks
+    return results
+
+
+def _key(result: Result) -> Tuple[str, int, int]:
+    return str(result["target"]), int(result["m"]), int(result["n"])
+
+
+def compare(baseline: Sequence[Result], current: Sequence[Result], threshold: float) -> List[Tuple[str, int, int, float]]:
+    """Print median ratios current/baseline and return cells slower by more than threshold."""
+    base = {_key(result): result for result in baseline}
+    regressions: List[Tuple[str, int, int, float]] = []
+    print(f"{'target':>16} {'m':>9} {'n':>9} {'base':>10} {'current':>10} {'ratio':>7}")
+    for result in current:
+        key = _key(result)
+        if key not in base:
+            continue
+        before = float(base[key]["median"])
+        after = float(result["median"])
+        ratio = after / before if before > 0 else float("inf")
+        flag = "  REGRESSION" if ratio > 1 + threshold else ""
+        print(f"{key[0]:>16} {key[1]:>9} {key[2]:>9} {before:10.6f} {after:10.6f} {ratio:7.3f}{flag}")
+        if flag:
+            regressions.append((*key, ratio))
+    return regressions
+
+
+def _load(path: Path) -> List[Result]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Lab 2 packing benchmarks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_cmd = commands.add_parser("run", help="Run the benchmark sweep and write JSON.")
+    run_cmd.add_argument("--out", type=Path, default=Path("bench/current.json"))
+    run_cmd.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    run_cmd.add_argument("--m", type=int, nargs="+", default=DEFAULT_M, help="Task counts (up to 10^7).")
+    run_cmd.add_argument("--n", type=int, nargs="+", default=DEFAULT_N, help="Machine counts (up to 10^7).")
+    run_cmd.add_argument("--repeats", type=int, default=5)
+    run_cmd.add_argument("--warmup", type=int, default=1)
+    run_cmd.add_argument("--seed", type=int, default=2024)
+
+    compare_cmd = commands.add_parser("compare", help="Compare two result files.")
+    compare_cmd.add_argument("baseline", type=Path)
+    compare_cmd.add_argument("current", type=Path)
+    compare_cmd.add_argument("--threshold", type=float, default=0.10, help="Allowed median slowdown (0.10 = 10%%).")
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressions = compare(_load(args.baseline), _load(args.current), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+        print("No regressions.")
+        return
+
+    results = run_suite(
+        args.targets,
+        args.m,
+        args.n,
+        repeats=args.repeats,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+    report = {
+        "meta": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "repeats": args.repeats,
+            "warmup": args.warmup,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Saved {len(results)} results to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
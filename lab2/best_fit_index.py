@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+
+
+class BestFitIndex:
+    """
+    Ordered index of levels keyed by remaining width for Best-Fit queries.
+
+    Widths live in [0, capacity]. Only widths that are present are stored:
+    a sorted list of K distinct widths and a heap of level indices per
+    width, so ties go to the lowest level. query and pop_best bisect in
+    O(log K) (pop_best adds O(K) when a width's bucket empties), insert is
+    O(log K) for a present width and O(K) for a new one: insort/del shift
+    the key list with one memmove. K <= min(entries, capacity + 1), so setup
+    and memory do not depend on capacity.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+
+        self.capacity = capacity
+        self.keys: List[int] = []  # sorted distinct widths with a non-empty bucket
+        self.buckets: Dict[int, List[int]] = {}
+
+    @classmethod
+    def from_items(cls, capacity: int, items: Iterable[Tuple[int, int]]) -> "BestFitIndex":
+        """Build from (level, width) pairs in O(k log k), k = number of pairs."""
+        index = cls(capacity)
+        buckets = index.buckets
+        for level, width in items:
+            if not (0 <= width <= capacity):
+                raise IndexError("width out of range")
+            bucket = buckets.get(width)
+            if bucket is None:
+                buckets[width] = [level]
+            else:
+                bucket.append(level)
+        for bucket in buckets.values():
+            heapq.heapify(bucket)
+        index.keys = sorted(buckets)
+        return index
+
+    def insert(self, level: int, width: int) -> None:
+        """Register a level with given free width."""
+        if not (0 <= width <= self.capacity):
+            raise IndexError("width out of range")
+
+        bucket = self.buckets.get(width)
+        if bucket is None:
+            self.buckets[width] = [level]
+            insort(self.keys, width)
+        else:
+            heapq.heappush(bucket, level)
+
+    def query(self, required_width: int) -> int:
+        """
+        Return the smallest free width >= required_width present in the index.
+        Returns -1 if no suitable level exists.
+        """
+        keys = self.keys
+        pos = bisect_left(keys, required_width)
+        return keys[pos] if pos < len(keys) else -1
+
+    def pop_best(self, required_width: int) -> int:
+        """
+        Remove and return the best-fitting level for required_width.
+        Returns -1 if no suitable level exists.
+        """
+        keys = self.keys
+        pos = bisect_left(keys, required_width)
+        if pos == len(keys):
+            return -1
+
+        width = keys[pos]
+        bucket = self.buckets[width]
+        level = heapq.heappop(bucket)
+        if not bucket:
+            del self.buckets[width]
+            del keys[pos]
+        return level
@@ -0,0 +1,91 @@
+"""Import-time budget for main.py, measured with `python -X importtime`.
+
+Usage:
+  python check_import_time.py
+  python check_import_time.py --budget-ms 150 --repeats 5
+
+Imports `main` in fresh interpreters and takes the best cumulative time of
+the `main` entry. Exits with status 1 if it exceeds the budget or if a heavy
+module (matplotlib, numpy) is imported at startup, so single mode stays fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+DEFAULT_BUDGET_MS = 250.0
+HEAVY_MODULES = ("matplotlib", "numpy")
+
+
+def measure_import(module: str, cwd: Path) -> Tuple[float, Dict[str, int]]:
+    """Cumulative import time of `module` in ms and cumulative us of every imported module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            modules[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # header line
+    if module not in modules:
+        raise RuntimeError(f"No -X importtime entry for {module}")
+    return modules[module] / 1000, modules
+
+
+def check(module: str, budget_ms: float, repeats: int, heavy: Sequence[str]) -> List[str]:
+    cwd = Path(__file__).resolve().parent
+    best = float("inf")
+    modules: Dict[str, int] = {}
+    for _ in range(repeats):
+        elapsed, modules = measure_import(module, cwd)
+        best = min(best, elapsed)
+
+    failures: List[str] = []
+    print(f"import {module}: {best:.1f} ms (budget {budget_ms:.0f} ms, best of {repeats})")
+    if best > budget_ms:
+        failures.append(f"import {module} takes {best:.1f} ms > {budget_ms:.0f} ms")
+    for name in heavy:
+        if name in modules:
+            failures.append(f"{name} is imported at startup ({modules[name] / 1000:.1f} ms)")
+
+    slowest = sorted(
+        ((name, micros) for name, micros in modules.items() if name not in (module, "site")),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:5]
+    for name, micros in slowest:
+        print(f"  {name}: {micros / 1000:.1f} ms")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail if importing main.py exceeds the startup budget.")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    if args.repeats <= 0:
+        parser.error("--repeats must be positive")
+
+    failures = check(args.module, args.budget_ms, args.repeats, HEAVY_MODULES)
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Dict, List, Tuple
+
+from schedule import Schedule
+from tournament_tree import TournamentTree
+
+
+def compact_schedule(schedule: Schedule) -> Tuple[Schedule, Dict[str, float]]:
+    """
+    Post-pass that removes whole levels by moving their tasks into the free
+    width of taller levels.
+
+    Levels are ranked by height descending and a TournamentTree is built
+    over their `remaining` widths in that order, so a First-Fit query
+    returns the tallest level with room. Starting from the shortest level,
+    every task of the level (widest first) goes to the first other level
+    with room; if the task is taller than that level, the level grows to
+    t_j. The level is removed only if the total growth stays below its own
+    height, i.e. T(S) strictly decreases; otherwise its moves are rolled
+    back. Each level is tried once, so the pass is O(m log L) after an
+    O(m log m) grouping.
+
+    Returns the compacted schedule (levels in ranking order) and a report:
+    t_before, t_after, reduction (relative), levels_removed, tasks_moved, seconds.
+    """
+    t0 = time.perf_counter()
+    n = schedule.n
+    heights = schedule.heights
+    count = len(heights)
+    t_before = sum(heights)
+
+    rank = sorted(range(count), key=lambda level: -heights[level])
+    position = array("q", [0]) * count
+    for pos, level in enumerate(rank):
+        position[level] = pos
+    level_height = array(heights.typecode, (heights[level] for level in rank))
+    free = array("q", (schedule.remaining[level] for level in rank))
+    tree = TournamentTree.from_values(free)
+
+    order, starts = schedule.level_order()
+    widths = schedule.task_width
+    task_heights = schedule.task_height
+    new_position = array("q", (position[level] for level in schedule.task_level))
+    new_offset = array("q", schedule.task_offset)
+    removed = bytearray(count)
+    received: Dict[int, List[int]] = {}  # position -> tasks moved onto it
+    tasks_moved = 0
+
+    for pos in range(count - 1, -1, -1):
+        level = rank[pos]
+        members = list(order[starts[level] : starts[level + 1]])
+        members.extend(received.pop(pos, ()))
+        members.sort(key=widths.__getitem__, reverse=True)
+        gain = level_height[pos]
+        cost = 0
+        moves: List[Tuple[int, int, int, float]] = []  # (task, target position, offset, target height before)
+        tree.update(pos, -1)  # never move onto the level being emptied
+        for task in members:
+            r = widths[task]
+            target = tree.query(r)
+            if target == -1:
+                break
+            t = task_heights[task]
+            before = level_height[target]
+            if t > before:
+                cost += t - before
+                if cost >= gain:
+                    break
+                level_height[target] = t
+            moves.append((task, target, n - free[target], before))
+            free[target] -= r
+            tree.update(target, free[target])
+        else:
+            for task, target, offset, _ in moves:
+                new_offset[task] = offset
+                new_position[task] = target
+                received.setdefault(target, []).append(task)
+            tasks_moved += len(moves)
+            removed[pos] = 1
+            free[pos] = -1  # gone: fits nothing
+            continue
+
+        for task, target, _, before in reversed(moves):
+            free[target] += widths[task]
+            level_height[target] = before
+            tree.update(target, free[target])
+        tree.update(pos, free[pos])
+
+    compacted = Schedule(n, height_code=heights.typecode)
+    renumber = array("q", [-1]) * count
+    for pos, level in enumerate(rank):
+        if not removed[pos]:
+            renumber[pos] = compacted.open_level(level_height[pos])
+            compacted.remaining[renumber[pos]] = free[pos]
+    compacted.task_level = array("q", (renumber[pos] for pos in new_position))
+    compacted.task_offset = new_offset
+    compacted.task_width = array("q", widths)
+    compacted.task_height = array(schedule.task_height.typecode, schedule.task_height)
+
+    t_after = sum(compacted.heights)
+    report = {
+        "t_before": t_before,
+        "t_after": t_after,
+        "reduction": (t_before - t_after) / t_before if t_before else 0.0,
+        "levels_removed": int(sum(removed)),
+        "tasks_moved": tasks_moved,
+        "seconds": time.perf_counter() - t0,
+    }
+    return compacted, report
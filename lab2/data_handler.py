@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import random
 import re
+from itertools import islice
 from pathlib import Path
-from typing import List, Tuple
+from typing import IO, Iterator, List, Tuple
 
 Task = Tuple[int, int]  # (r_j, t_j)
 
@@ -19,67 +20,103 @@ def generate_random_tasks(m: int, n: int, *, seed: int | None = None) -> List[Ta
     return [(rng.randint(1, n), rng.randint(1, 100)) for _ in range(m)]
 
 
-def parse_llnl_logs(
-    filepath: str | Path,
-    m: int,
-    *,
-    offset: int = 0,
-    max_width: int | None = None,
-) -> List[Task]:
+SwfJob = Tuple[int, int, int, int]  # (line_no, submit_time, r_j, t_j)
+
+
+def parse_swf_line(line: str) -> Tuple[int, int, int] | None:
     """
-    Parse first m valid tasks from SWF logs.
+    Parse one SWF line into (submit_time, r_j, t_j), or None if it is not a valid job.
     Uses:
+      - submit time: column 2 (index 1), -1 if unparsable
       - run time: column 4 (index 3)
       - requested processors: column 8 (index 7), fallback to allocated processors (index 4)
+    Jobs with non-positive r_j or t_j are rejected.
     """
-    if m <= 0:
-        return []
-    if offset < 0:
-        raise ValueError("offset must be non-negative")
+    line = line.strip()
+    if not line or line.startswith(";"):
+        return None
+
+    parts = line.split()
+    if len(parts) < 5:
+        return None
+
+    try:
+        t = int(float(parts[3]))
+        req_proc = int(float(parts[7])) if len(parts) > 7 else -1
+        alloc_proc = int(float(parts[4]))
+    except (ValueError, OverflowError):
+        return None
+
+    r = req_proc if req_proc > 0 else alloc_proc
+    if r <= 0 or t <= 0:
+        return None
+
+    try:
+        submit = int(float(parts[1]))
+    except (ValueError, OverflowError):
+        submit = -1
+    return submit, r, t
+
 
+COMPRESSED_SUFFIXES = (".gz", ".xz", ".bz2")
+
+
+def open_trace(filepath: str | Path, *, binary: bool = False) -> IO:
+    """Open a trace for reading, decompressing .gz/.xz/.bz2 transparently by suffix."""
     path = Path(filepath)
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    tasks: List[Task] = []
-    skipped = 0
-    with path.open("r", encoding="utf-8", errors="ignore") as file:
-        for raw in file:
-            line = raw.strip()
-            if not line or line.startswith(";"):
-                continue
-
-            parts = line.split()
-            if len(parts) < 5:
-                continue
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        import gzip as codec
+    elif suffix == ".xz":
+        import lzma as codec
+    elif suffix == ".bz2":
+        import bz2 as codec
+    else:
+        return path.open("rb") if binary else path.open("r", encoding="utf-8", errors="ignore")
+    if binary:
+        return codec.open(path, "rb")
+    return codec.open(path, "rt", encoding="utf-8", errors="ignore")
+
+
+def iter_swf_jobs(filepath: str | Path) -> Iterator[SwfJob]:
+    """Lazily yield valid jobs (line_no, submit, r_j, t_j) from SWF logs, one line at a time."""
+    with open_trace(filepath) as file:
+        for line_no, raw in enumerate(file, start=1):
+            job = parse_swf_line(raw)
+            if job is not None:
+                yield (line_no, *job)
 
-            try:
-                t = int(float(parts[3]))
-                req_proc = int(float(parts[7])) if len(parts) > 7 else -1
-                alloc_proc = int(float(parts[4]))
-            except ValueError:
-                continue
 
-            r = req_proc if req_proc > 0 else alloc_proc
-            if r <= 0 or t <= 0:
-                continue
-            if max_width is not None and r > max_width:
-                continue
+def iter_llnl_tasks(filepath: str | Path, *, max_width: int | None = None) -> Iterator[Task]:
+    """Lazily yield valid (r_j, t_j) tasks from SWF logs (see iter_swf_jobs)."""
+    for _, _, r, t in iter_swf_jobs(filepath):
+        if max_width is not None and r > max_width:
+            continue
+        yield r, t
 
-            if skipped < offset:
-                skipped += 1
-                continue
 
-            tasks.append((r, t))
-            if len(tasks) >= m:
-                break
+def parse_llnl_logs(
+    filepath: str | Path,
+    m: int,
+    *,
+    offset: int = 0,
+    max_width: int | None = None,
+) -> List[Task]:
+    """Parse first m valid tasks from SWF logs, skipping `offset` valid tasks."""
+    if m <= 0:
+        return []
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
 
-    return tasks
+    return list(islice(iter_llnl_tasks(filepath, max_width=max_width), offset, offset + m))
 
 
-def parse_tasks_file(filepath: str | Path) -> List[Task]:
+def iter_tasks_file(filepath: str | Path) -> Iterator[Task]:
     """
-    Parse tasks from a plain text file.
+    Lazily yield tasks from a plain text file.
     Expected one task per line: "r_j t_j" (comma/semicolon are also accepted).
     Lines starting with '#' are ignored.
     """
@@ -87,7 +124,6 @@ def parse_tasks_file(filepath: str | Path) -> List[Task]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    tasks: List[Task] = []
     with path.open("r", encoding="utf-8", errors="ignore") as file:
         for line_no, raw in enumerate(file, start=1):
             line = raw.strip()
@@ -108,6 +144,9 @@ def parse_tasks_file(filepath: str | Path) -> List[Task]:
             if r <= 0 or t <= 0:
                 raise ValueError(f"Task values must be positive at line {line_no}: '{line}'")
 
-            tasks.append((r, t))
+            yield r, t
 
-    return tasks
+
+def parse_tasks_file(filepath: str | Path) -> List[Task]:
+    """Parse all tasks from a plain text file (see iter_tasks_file)."""
+    return list(iter_tasks_file(filepath))
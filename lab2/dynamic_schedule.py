@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Tuple
+
+from schedule import Schedule
+from tournament_tree import TournamentTree
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+
+class DynamicSchedule:
+    """
+    Level schedule of a live queue, kept up to date task by task.
+
+    A new task goes to the first level (in opening order) with enough free
+    width, found with TournamentTree.query, or to a new level. A level's
+    height is the tallest task on it: each level keeps a max-heap of its
+    tasks, removals are lazy and the height is recomputed from the heap top.
+    Levels emptied by removals stay in the tree with full width and are
+    reused by later tasks.
+
+    add, remove: O(log L + log k) amortized (L levels, k tasks on the level);
+    makespan: O(1), the sum of level heights is maintained incrementally.
+
+    Unlike FFDH on the whole set, tasks are placed in arrival order, so the
+    makespan can exceed that of a full recomputation (see bench_dynamic.py).
+    """
+
+    def __init__(self, n: int) -> None:
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        self.n = n
+        self._tree = TournamentTree()
+        self._free: List[int] = []
+        self._heights: List[int] = []
+        self._level_heaps: List[List[Tuple[int, int]]] = []  # (-t_j, task_id), removed ids dropped lazily
+        self._counts: List[int] = []  # live tasks per level
+        self._tasks: Dict[int, Tuple[int, int, int]] = {}  # task_id -> (level, r_j, t_j)
+        self._next_id = 0
+        self._makespan = 0
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self._tasks
+
+    @property
+    def level_count(self) -> int:
+        """Levels ever opened, including ones emptied by removals."""
+        return len(self._heights)
+
+    def makespan(self) -> int:
+        """Objective T(S): sum of level heights."""
+        return self._makespan
+
+    def add(self, task: Task) -> int:
+        """Place a task and return its id for remove()."""
+        r, t = task
+        if r <= 0:
+            raise ValueError("Task width r_j must be positive")
+        if r > self.n:
+            raise ValueError(f"Task width r_j={r} exceeds machine capacity n={self.n}")
+
+        level = self._tree.query(r)
+        if level == -1:
+            level = self._tree.append(self.n)
+            self._free.append(self.n)
+            self._heights.append(0)
+            self._level_heaps.append([])
+            self._counts.append(0)
+
+        task_id = self._next_id
+        self._next_id += 1
+        self._tasks[task_id] = (level, r, t)
+        self._free[level] -= r
+        self._tree.update(level, self._free[level])
+        heapq.heappush(self._level_heaps[level], (-t, task_id))
+        self._counts[level] += 1
+        if t > self._heights[level]:
+            self._makespan += t - self._heights[level]
+            self._heights[level] = t
+        return task_id
+
+    def remove(self, task_id: int) -> Task:
+        """Remove a task by id, recompute its level height and return (r_j, t_j)."""
+        try:
+            level, r, t = self._tasks.pop(task_id)
+        except KeyError:
+            raise KeyError(f"Unknown task id {task_id}") from None
+
+        self._free[level] += r
+        self._tree.update(level, self._free[level])
+
+        self._counts[level] -= 1
+        heap = self._level_heaps[level]
+        if len(heap) > 2 * self._counts[level] + 8:
+            # Mostly removed entries: rebuild so heaps stay O(live tasks).
+            heap[:] = [entry for entry in heap if entry[1] in self._tasks]
+            heapq.heapify(heap)
+        while heap and heap[0][1] not in self._tasks:
+            heapq.heappop(heap)
+        height = -heap[0][0] if heap else 0
+        self._makespan += height - self._heights[level]
+        self._heights[level] = height
+        return r, t
+
+    def tasks(self) -> Dict[int, Task]:
+        """Current tasks by id."""
+        return {task_id: (r, t) for task_id, (_, r, t) in self._tasks.items()}
+
+    def to_schedule(self) -> Schedule:
+        """Snapshot as a Schedule: non-empty levels in opening order, tasks packed left to right."""
+        schedule = Schedule(self.n)
+        by_level: List[List[Task]] = [[] for _ in self._heights]
+        for level, r, t in self._tasks.values():
+            by_level[level].append((r, t))
+        for level, level_tasks in enumerate(by_level):
+            if not level_tasks:
+                continue
+            index = schedule.open_level(self._heights[level])
+            for r, t in level_tasks:
+                schedule.place(index, r, t)
+        return schedule
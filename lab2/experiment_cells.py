@@ -0,0 +1,197 @@
+"""Experiment cells: the code that turns (m, n, seed, source) into cached numbers.
+
+result_cache.CODE_FILES hashes this module, not main.py, so edits to
+plotting, reporting or the CLI keep cached cells valid.
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from algorithms import ALGORITHMS
+from data_handler import generate_random_tasks
+from pipeline import prepare
+from result_cache import ResultCache, cell_key
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+LLNL_PATH = Path("data/LLNL-UBGL-2006-2.swf")
+EXPERIMENT_ALGORITHMS = ("NFDH", "FFDH")
+MEMORY_ALGORITHMS = ("NFDH", "FFDH", "BFDH")
+
+
+def run_one_dataset(
+    load_tasks: Callable[[], Sequence[Task] | None],
+    n: int,
+    *,
+    m: int,
+    seed: int | None,
+    source: str,
+    cache: ResultCache | None = None,
+) -> Dict[str, float] | None:
+    """
+    Runtimes and epsilons of the experiment algorithms on one cell.
+    Algorithms found in the cache are not rerun; tasks are only loaded
+    (load_tasks() returning None means the cell has no data) when one is missing.
+    """
+    per_algorithm: Dict[str, Dict[str, float] | None] = {}
+    keys: Dict[str, str] = {}
+    for algorithm in EXPERIMENT_ALGORITHMS:
+        if cache is not None:
+            keys[algorithm] = cell_key(algorithm, m, n, seed, source)
+            per_algorithm[algorithm] = cache.get(keys[algorithm])
+        else:
+            per_algorithm[algorithm] = None
+
+    missing = [algorithm for algorithm, result in per_algorithm.items() if result is None]
+    if missing:
+        tasks = load_tasks()
+        if tasks is None:
+            return None
+        # One sort and one area pass shared by the algorithms; each runtime
+        # still includes the shared preparation, i.e. the standalone cost.
+        for algorithm, result in prepare(tasks, n).run(missing).items():
+            entry = {"runtime": result["runtime"], "epsilon": result["epsilon"], "t_s": result["t_s"]}
+            per_algorithm[algorithm] = entry
+            if cache is not None:
+                cache.put(keys[algorithm], entry)
+
+    return {
+        "nfdh_runtime": per_algorithm["NFDH"]["runtime"],
+        "ffdh_runtime": per_algorithm["FFDH"]["runtime"],
+        "nfdh_eps": per_algorithm["NFDH"]["epsilon"],
+        "ffdh_eps": per_algorithm["FFDH"]["epsilon"],
+    }
+
+
+def make_tasks(m: int, n: int, seed: int, distribution: str | None) -> List[Task]:
+    """Legacy uniform generator by default, vectorized generators.py otherwise."""
+    if distribution is None:
+        return generate_random_tasks(m, n, seed=seed)
+
+    from generators import generate_tasks
+
+    if distribution == "empirical":
+        return generate_tasks(m, n, seed=seed, distribution=distribution, source=LLNL_PATH)
+    return generate_tasks(m, n, seed=seed, distribution=distribution)
+
+
+def random_source(distribution: str | None) -> str:
+    if distribution is None:
+        return "random:legacy"
+    if distribution == "empirical":
+        from swf_store import SwfStore
+
+        meta = SwfStore.open(LLNL_PATH).meta
+        return f"random:empirical:{meta['size']}:{meta['sample_hash']}"
+    return f"random:{distribution}"
+
+
+# Each cell seeds its own generator from (m, n, run_idx), so its task set
+# does not depend on which worker runs it or in which order.
+def time_cell(
+    m: int,
+    n: int,
+    distribution: str | None = None,
+    cache: ResultCache | None = None,
+) -> Dict[str, float]:
+    seed = 1000 + m + n
+    return run_one_dataset(
+        lambda: make_tasks(m, n, seed, distribution),
+        n,
+        m=m,
+        seed=seed,
+        source=random_source(distribution),
+        cache=cache,
+    )
+
+
+def random_cell(
+    m: int,
+    n: int,
+    run_idx: int,
+    distribution: str | None = None,
+    cache: ResultCache | None = None,
+) -> Dict[str, float]:
+    seed = 10_000 + m * 100 + run_idx
+    return run_one_dataset(
+        lambda: make_tasks(m, n, seed, distribution),
+        n,
+        m=m,
+        seed=seed,
+        source=random_source(distribution),
+        cache=cache,
+    )
+
+
+def batched_random_cell(
+    m: int,
+    n: int,
+    runs: int,
+    distribution: str | None = None,
+) -> Dict[str, List[float]]:
+    """All runs of one m at once through batched.py (same seeds as random_cell)."""
+    from batched import pack_batch, stack_instances
+
+    widths, heights = stack_instances(
+        [make_tasks(m, n, 10_000 + m * 100 + run_idx, distribution) for run_idx in range(runs)]
+    )
+    _, nfdh_eps = pack_batch(widths, heights, n, "NFDH")
+    _, ffdh_eps = pack_batch(widths, heights, n, "FFDH")
+    return {"nfdh_eps": nfdh_eps.tolist(), "ffdh_eps": ffdh_eps.tolist()}
+
+
+def llnl_cell(
+    log_path: Path,
+    m: int,
+    n: int,
+    run_idx: int,
+    cache: ResultCache | None = None,
+) -> Dict[str, float] | None:
+    # Use different contiguous slices of the log per run; the column store
+    # makes each slice a direct read instead of a re-parse from line 1.
+    from swf_store import SwfStore
+
+    store = SwfStore.open(log_path)
+
+    def load_tasks() -> List[Task] | None:
+        tasks = store.tasks(m, offset=run_idx * m, max_width=n)
+        return tasks if len(tasks) == m else None
+
+    return run_one_dataset(
+        load_tasks,
+        n,
+        m=m,
+        seed=run_idx,
+        source=f"swf:{store.meta['size']}:{store.meta['sample_hash']}",
+        cache=cache,
+    )
+
+
+def measure_memory(algorithm: str, tasks: Sequence[Task], n: int) -> Dict[str, float]:
+    """
+    Memory of one sort + pack, input excluded:
+      peak_bytes (tracemalloc peak), retained_bytes (still held by the result),
+      objects (allocator blocks held by the result, i.e. live objects and buffers).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        blocks_before = sys.getallocatedblocks()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = ALGORITHMS[algorithm](tasks, n)
+        current, peak = tracemalloc.get_traced_memory()
+        objects = sys.getallocatedblocks() - blocks_before
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"peak_bytes": peak - baseline, "retained_bytes": current - baseline, "objects": objects}
+
+
+def memory_cell(m: int, n: int, distribution: str | None = None) -> Dict[str, Dict[str, float]]:
+    tasks = make_tasks(m, n, 1000 + m + n, distribution)
+    return {algorithm: measure_memory(algorithm, tasks, n) for algorithm in MEMORY_ALGORITHMS}
@@ -0,0 +1,124 @@
+"""Vectorized random task generators for large experiments.
+
+All samplers draw from one numpy.random.Generator seeded with `seed`, so a
+(seed, distribution, parameters) triple always yields the same arrays.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+Task = Tuple[int, int]  # (r_j, t_j)
+TaskArrays = Tuple[np.ndarray, np.ndarray]  # (widths, durations), int64
+Sampler = Callable[..., TaskArrays]
+
+DISTRIBUTIONS: Dict[str, Sampler] = {}
+
+
+def register_distribution(name: str) -> Callable[[Sampler], Sampler]:
+    """Register sampler(rng, m, n, **params) -> (widths, durations)."""
+
+    def decorator(func: Sampler) -> Sampler:
+        DISTRIBUTIONS[name] = func
+        return func
+
+    return decorator
+
+
+def _log_uniform_int(rng: np.random.Generator, high: int, m: int) -> np.ndarray:
+    """Integers in [1, high] with log-uniform density."""
+    values = np.floor(np.exp(rng.uniform(0.0, np.log(high + 1), m)))
+    return np.clip(values, 1, high).astype(np.int64)
+
+
+def _pareto_int(rng: np.random.Generator, alpha: float, scale: float, cap: int | None, m: int) -> np.ndarray:
+    """Integers >= max(1, floor(scale)) from a Pareto (Lomax + 1) tail, optionally capped."""
+    values = np.floor(scale * (1.0 + rng.pareto(alpha, m)))
+    if cap is not None:
+        values = np.minimum(values, cap)
+    return np.maximum(values, 1).astype(np.int64)
+
+
+@register_distribution("uniform")
+def _uniform(rng: np.random.Generator, m: int, n: int, *, max_duration: int = 100) -> TaskArrays:
+    """Same ranges as data_handler.generate_random_tasks: r_j in [1, n], t_j in [1, max_duration]."""
+    widths = rng.integers(1, n, size=m, endpoint=True, dtype=np.int64)
+    durations = rng.integers(1, max_duration, size=m, endpoint=True, dtype=np.int64)
+    return widths, durations
+
+
+@register_distribution("loguniform")
+def _loguniform(rng: np.random.Generator, m: int, n: int, *, max_duration: int = 100) -> TaskArrays:
+    """Many narrow/short tasks, few wide/long ones: log r_j and log t_j uniform."""
+    return _log_uniform_int(rng, n, m), _log_uniform_int(rng, max_duration, m)
+
+
+@register_distribution("pareto")
+def _pareto(
+    rng: np.random.Generator,
+    m: int,
+    n: int,
+    *,
+    alpha: float = 1.5,
+    scale: float = 10.0,
+    width_scale: float = 1.0,
+    max_duration: int | None = None,
+) -> TaskArrays:
+    """Heavy-tailed t_j (Pareto with index alpha), r_j Pareto-like and capped at n."""
+    widths = _pareto_int(rng, alpha, width_scale, n, m)
+    durations = _pareto_int(rng, alpha, scale, max_duration, m)
+    return widths, durations
+
+
+@register_distribution("empirical")
+def _empirical(rng: np.random.Generator, m: int, n: int, *, source: str | Path) -> TaskArrays:
+    """Resample (r_j, t_j) pairs jointly from an SWF trace, jobs wider than n excluded."""
+    from swf_store import SwfStore
+
+    store = SwfStore.open(source)
+    widths, durations = store.slice(len(store), max_width=n)
+    if len(widths) == 0:
+        raise ValueError(f"No tasks with r_j <= {n} in {source}")
+    picks = rng.integers(0, len(widths), size=m)
+    return np.asarray(widths)[picks], np.asarray(durations)[picks]
+
+
+def generate_task_arrays(
+    m: int,
+    n: int,
+    *,
+    seed: int | None = None,
+    distribution: str = "uniform",
+    **params: object,
+) -> TaskArrays:
+    """Generate m tasks as (widths, durations) int64 arrays."""
+    if n <= 0:
+        raise ValueError("n must be positive")
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution {distribution}; available: {', '.join(DISTRIBUTIONS)}")
+    if m <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+
+    rng = np.random.default_rng(seed)
+    return DISTRIBUTIONS[distribution](rng, m, n, **params)
+
+
+def tasks_from_arrays(widths: np.ndarray, durations: np.ndarray) -> List[Task]:
+    """Convert generator output to the (r_j, t_j) list used by the packing algorithms."""
+    return list(zip(widths.tolist(), durations.tolist()))
+
+
+def generate_tasks(
+    m: int,
+    n: int,
+    *,
+    seed: int | None = None,
+    distribution: str = "uniform",
+    **params: object,
+) -> List[Task]:
+    """generate_task_arrays as a task list."""
+    return tasks_from_arrays(*generate_task_arrays(m, n, seed=seed, distribution=distribution, **params))
@@ -0,0 +1,172 @@
+"""Load generator for service.py: request latency percentiles and throughput.
+
+Usage:
+  python service.py &                                # in another shell
+  python load_service.py --clients 16 --requests 200 --m 500
+  python load_service.py --port 8765 --algorithm NFDH --no-schedule --depth 8
+  python load_service.py --subprocess 20             # also time main.py --mode single per request
+
+Each client opens its own connection and keeps `depth` requests in flight
+until it has sent `requests`. Latency is measured from sending a request
+line to reading its response; "busy" answers count as rejected, not as
+latencies. With --subprocess K, the same task set is packed K times by
+spawning `main.py --mode single`, the way the broker used to call it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from data_handler import generate_random_tasks
+from service import DEFAULT_SOCKET
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile, q in [0, 100]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, min(len(ordered), round(q / 100 * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+async def _open(socket_path: Path, port: int | None):
+    if port is not None:
+        return await asyncio.open_connection("127.0.0.1", port, limit=64 << 20)
+    return await asyncio.open_unix_connection(str(socket_path), limit=64 << 20)
+
+
+async def _client(
+    client: int,
+    args: argparse.Namespace,
+    payloads: List[bytes],
+    latencies: List[float],
+    counters: Dict[str, int],
+) -> None:
+    reader, writer = await _open(args.socket, args.port)
+    sent_at: Dict[int, float] = {}
+    window = asyncio.Semaphore(args.depth)
+
+    async def receive() -> None:
+        for _ in range(args.requests):
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError("service closed the connection")
+            response = json.loads(line)
+            started = sent_at.pop(response.get("id"), None)
+            window.release()
+            if started is None:  # "id": null, the service could not parse the request
+                counters["errors"] += 1
+            elif response["ok"]:
+                latencies.append(time.perf_counter() - started)
+            elif response["error"] == "busy":
+                counters["rejected"] += 1
+            else:
+                counters["errors"] += 1
+
+    receiver = asyncio.create_task(receive())
+    for seq in range(args.requests):
+        await window.acquire()
+        request_id = client * args.requests + seq
+        sent_at[request_id] = time.perf_counter()
+        writer.write(payloads[seq % len(payloads)].replace(b'"id":null', f'"id":{request_id}'.encode(), 1))
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(args: argparse.Namespace) -> Dict[str, float]:
+    rng = random.Random(args.seed)
+    payloads = []
+    for _ in range(args.variants):
+        tasks = generate_random_tasks(args.m, args.n, seed=rng.randrange(1 << 30))
+        message = {"id": None, "n": args.n, "algorithm": args.algorithm, "tasks": tasks, "schedule": args.schedule}
+        payloads.append(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+    latencies: List[float] = []
+    counters = {"rejected": 0, "errors": 0}
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_client(client, args, payloads, latencies, counters) for client in range(args.clients)))
+    elapsed = time.perf_counter() - t0
+    return {
+        "completed": len(latencies),
+        "rejected": counters["rejected"],
+        "errors": counters["errors"],
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(latencies, 50),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies, default=0.0),
+    }
+
+
+def run_subprocess_baseline(args: argparse.Namespace, count: int) -> Dict[str, float]:
+    """Latency of one `main.py --mode single` process per request, output discarded."""
+    main_py = Path(__file__).resolve().parent / "main.py"
+    tasks = generate_random_tasks(args.m, args.n, seed=args.seed)
+    latencies: List[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "tasks.txt"
+        path.write_text("".join(f"{r} {t}\n" for r, t in tasks), encoding="utf-8")
+        command = [
+            sys.executable, str(main_py), "--mode", "single", "--input-file", str(path),
+            "--n", str(args.n), "--algorithm", args.algorithm,
+        ]
+        for _ in range(count):
+            t0 = time.perf_counter()
+            subprocess.run(command, check=True, stdout=subprocess.DEVNULL, cwd=main_py.parent)
+            latencies.append(time.perf_counter() - t0)
+    return {"p50": percentile(latencies, 50), "p99": percentile(latencies, 99)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure service.py latency under concurrent load.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET)
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--clients", type=int, default=8, help="Concurrent connections.")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per client.")
+    parser.add_argument("--depth", type=int, default=1, help="Requests in flight per client.")
+    parser.add_argument("--m", type=int, default=500, help="Tasks per request.")
+    parser.add_argument("--n", type=int, default=1024)
+    parser.add_argument("--algorithm", type=str.upper, default="FFDH")
+    parser.add_argument("--no-schedule", dest="schedule", action="store_false", help="Ask for T(S)/epsilon only.")
+    parser.add_argument("--variants", type=int, default=16, help="Distinct task sets cycled through.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--subprocess", type=int, default=0, help="Also time K runs of main.py --mode single.")
+    args = parser.parse_args()
+    for name in ("clients", "requests", "depth", "m", "n", "variants"):
+        if getattr(args, name) <= 0:
+            parser.error(f"--{name} must be positive")
+
+    report = asyncio.run(run_load(args))
+    print(
+        f"clients={args.clients} depth={args.depth} m={args.m} n={args.n} "
+        f"algorithm={args.algorithm} schedule={args.schedule}"
+    )
+    print(
+        f"completed={report['completed']} rejected={report['rejected']} errors={report['errors']} "
+        f"in {report['seconds']:.2f} s ({report['throughput']:.0f} req/s)"
+    )
+    print(f"latency p50={report['p50'] * 1000:.2f} ms p99={report['p99'] * 1000:.2f} ms max={report['max'] * 1000:.2f} ms")
+    if args.subprocess:
+        baseline = run_subprocess_baseline(args, args.subprocess)
+        print(
+            f"main.py --mode single per request: p50={baseline['p50'] * 1000:.1f} ms "
+            f"p99={baseline['p99'] * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
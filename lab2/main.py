@@ -1,71 +1,147 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
 import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Sequence, Tuple
-
-from algorithms import ffdh, nfdh
-from data_handler import generate_random_tasks, parse_llnl_logs, parse_tasks_file
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, TypeVar
+
+from algorithms import ALGORITHMS, instrumented
+from compaction import compact_schedule
+from data_handler import iter_llnl_tasks, iter_tasks_file, parse_tasks_file
+from experiment_cells import (
+    LLNL_PATH,
+    MEMORY_ALGORITHMS,
+    batched_random_cell,
+    llnl_cell,
+    memory_cell,
+    random_cell,
+    time_cell,
+)
 from metrics import get_epsilon, get_lower_bound, get_stats
-from plotter import plot_accuracy, plot_time_complexity
+from pipeline import prepare
+# NumPy-backed modules (swf_store, generators) are imported where used, here
+# and in experiment_cells, so --mode single does not pay for them; plotter
+# defers matplotlib the same way.
+from plotter import plot_accuracy, plot_memory_complexity, plot_time_complexity
+from result_cache import DEFAULT_DIRECTORY, DEFAULT_MAX_BYTES, ResultCache
+from schedule import Schedule
+from schedule_io import BINARY_FORMATS, FORMATS, format_level
+from streaming import check_sorted, external_sort, stream_nfdh
 
 Task = Tuple[int, int]  # (r_j, t_j)
-Schedule = List[Dict[str, object]]
-
-
-def _run_one_dataset(tasks: Sequence[Task], n: int) -> Dict[str, float]:
-    t0 = time.perf_counter()
-    _, nfdh_t = nfdh(tasks, n)
-    nfdh_runtime = time.perf_counter() - t0
-
-    t1 = time.perf_counter()
-    _, ffdh_t = ffdh(tasks, n)
-    ffdh_runtime = time.perf_counter() - t1
-
-    t_prime = get_lower_bound(tasks, n)
-    return {
-        "nfdh_runtime": nfdh_runtime,
-        "ffdh_runtime": ffdh_runtime,
-        "nfdh_eps": get_epsilon(nfdh_t, t_prime),
-        "ffdh_eps": get_epsilon(ffdh_t, t_prime),
-    }
-
-
-def experiment_time_complexity(m_values: Sequence[int], n_values: Sequence[int]) -> None:
+R = TypeVar("R")
+
+DISTRIBUTION_CHOICES = ["uniform", "loguniform", "pareto", "empirical"]
+
+
+def _map_cells(func: Callable[..., R], cells: Sequence[Tuple], jobs: int = 1) -> List[R]:
+    """
+    Evaluate func(*cell) for every cell, in a process pool when jobs > 1
+    (jobs = 0 uses all cores). Results come back in cell order, so serial
+    and parallel runs merge identically.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1 or len(cells) <= 1:
+        return [func(*cell) for cell in cells]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs, len(cells))
+    chunksize = max(1, len(cells) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, *zip(*cells), chunksize=chunksize))
+
+
+def experiment_time_complexity(
+    m_values: Sequence[int],
+    n_values: Sequence[int],
+    *,
+    jobs: int = 1,
+    distribution: str | None = None,
+    cache: ResultCache | None = None,
+) -> None:
     series: "OrderedDict[str, List[float]]" = OrderedDict()
     for n in n_values:
         series[f"NFDH (n={n})"] = []
         series[f"FFDH (n={n})"] = []
 
-    for m in m_values:
-        for n in n_values:
-            tasks = generate_random_tasks(m, n, seed=1000 + m + n)
-            result = _run_one_dataset(tasks, n)
-            series[f"NFDH (n={n})"].append(result["nfdh_runtime"])
-            series[f"FFDH (n={n})"].append(result["ffdh_runtime"])
+    cells = [(m, n, distribution, cache) for m in m_values for n in n_values]
+    for (_, n, _, _), result in zip(cells, _map_cells(time_cell, cells, jobs)):
+        series[f"NFDH (n={n})"].append(result["nfdh_runtime"])
+        series[f"FFDH (n={n})"].append(result["ffdh_runtime"])
 
     plot_time_complexity(m_values, series, filename="time_complexity.png")
 
 
-def experiment_random_stats(m_values: Sequence[int], n: int, runs: int = 10) -> None:
+def experiment_memory_complexity(
+    m_values: Sequence[int],
+    n_values: Sequence[int],
+    *,
+    jobs: int = 1,
+    distribution: str | None = None,
+) -> None:
+    """Peak and retained memory, object counts and bytes per task over the time-complexity grid."""
+    peak: "OrderedDict[str, List[float]]" = OrderedDict()
+    per_task: "OrderedDict[str, List[float]]" = OrderedDict()
+    for n in n_values:
+        for algorithm in MEMORY_ALGORITHMS:
+            peak[f"{algorithm} (n={n})"] = []
+            per_task[f"{algorithm} (n={n})"] = []
+
+    print(f"{'algorithm':>9} {'n':>6} {'m':>7} {'peak_bytes':>11} {'retained':>10} {'objects':>8} {'B/task':>8}")
+    cells = [(m, n, distribution) for m in m_values for n in n_values]
+    for (m, n, _), result in zip(cells, _map_cells(memory_cell, cells, jobs)):
+        for algorithm in MEMORY_ALGORITHMS:
+            row = result[algorithm]
+            bytes_per_task = row["peak_bytes"] / m
+            peak[f"{algorithm} (n={n})"].append(row["peak_bytes"])
+            per_task[f"{algorithm} (n={n})"].append(bytes_per_task)
+            print(
+                f"{algorithm:>9} {n:>6} {m:>7} {row['peak_bytes']:>11} {row['retained_bytes']:>10} "
+                f"{row['objects']:>8} {bytes_per_task:>8.1f}"
+            )
+
+    plot_memory_complexity(m_values, peak, per_task, filename="memory_complexity.png")
+
+
+def experiment_random_stats(
+    m_values: Sequence[int],
+    n: int,
+    runs: int = 10,
+    *,
+    jobs: int = 1,
+    distribution: str | None = None,
+    cache: ResultCache | None = None,
+    batched: bool = False,
+) -> None:
+    """
+    Mean and std of epsilon over `runs` random instances per m. With
+    batched=True all runs of one m are packed together by batched.py
+    (one cell per m, result cache not used); epsilons are identical.
+    """
     nfdh_mean: List[float] = []
     nfdh_std: List[float] = []
     ffdh_mean: List[float] = []
     ffdh_std: List[float] = []
 
-    for m in m_values:
-        nfdh_eps_list: List[float] = []
-        ffdh_eps_list: List[float] = []
-        for run_idx in range(runs):
-            tasks = generate_random_tasks(m, n, seed=10_000 + m * 100 + run_idx)
-            result = _run_one_dataset(tasks, n)
-            nfdh_eps_list.append(result["nfdh_eps"])
-            ffdh_eps_list.append(result["ffdh_eps"])
-
-        m1, s1 = get_stats(nfdh_eps_list)
-        m2, s2 = get_stats(ffdh_eps_list)
+    if batched:
+        batches = _map_cells(batched_random_cell, [(m, n, runs, distribution) for m in m_values], jobs)
+        per_m_eps = [(batch["nfdh_eps"], batch["ffdh_eps"]) for batch in batches]
+    else:
+        cells = [(m, n, run_idx, distribution, cache) for m in m_values for run_idx in range(runs)]
+        results = _map_cells(random_cell, cells, jobs)
+        per_m_eps = []
+        for pos in range(len(m_values)):
+            per_m = results[pos * runs : (pos + 1) * runs]
+            per_m_eps.append(([result["nfdh_eps"] for result in per_m], [result["ffdh_eps"] for result in per_m]))
+
+    for nfdh_eps, ffdh_eps in per_m_eps:
+        m1, s1 = get_stats(nfdh_eps)
+        m2, s2 = get_stats(ffdh_eps)
         nfdh_mean.append(m1)
         nfdh_std.append(s1)
         ffdh_mean.append(m2)
@@ -82,7 +158,15 @@ def experiment_random_stats(m_values: Sequence[int], n: int, runs: int = 10) ->
     )
 
 
-def experiment_llnl_stats(m_values: Sequence[int], n: int, log_path: Path, runs: int = 10) -> None:
+def experiment_llnl_stats(
+    m_values: Sequence[int],
+    n: int,
+    log_path: Path,
+    runs: int = 10,
+    *,
+    jobs: int = 1,
+    cache: ResultCache | None = None,
+) -> None:
     if not log_path.exists():
         print(f"LLNL file not found, skipping experiment: {log_path}")
         return
@@ -92,15 +176,17 @@ def experiment_llnl_stats(m_values: Sequence[int], n: int, log_path: Path, runs:
     ffdh_mean: List[float] = []
     ffdh_std: List[float] = []
 
-    for m in m_values:
+    from swf_store import SwfStore
+
+    SwfStore.open(log_path)  # build or refresh the cache once, before workers read it
+    cells = [(log_path, m, n, run_idx, cache) for m in m_values for run_idx in range(runs)]
+    results = _map_cells(llnl_cell, cells, jobs)
+    for pos, m in enumerate(m_values):
         nfdh_eps_list: List[float] = []
         ffdh_eps_list: List[float] = []
-        for run_idx in range(runs):
-            # Use different contiguous slices of the log per run.
-            tasks = parse_llnl_logs(log_path, m, offset=run_idx * m, max_width=n)
-            if len(tasks) < m:
+        for result in results[pos * runs : (pos + 1) * runs]:
+            if result is None:
                 break
-            result = _run_one_dataset(tasks, n)
             nfdh_eps_list.append(result["nfdh_eps"])
             ffdh_eps_list.append(result["ffdh_eps"])
 
@@ -128,63 +214,222 @@ def experiment_llnl_stats(m_values: Sequence[int], n: int, log_path: Path, runs:
         )
 
 
-def _format_schedule(schedule: Schedule) -> str:
-    rows: List[str] = []
-    current_time = 0
-    for idx, level in enumerate(schedule, start=1):
-        height = int(level["height"])
-        remaining = int(level["remaining"])
-        tasks = level["tasks"]
-        rows.append(
-            f"level={idx}, start={current_time}, end={current_time + height}, "
-            f"height={height}, remaining={remaining}, tasks={tasks}"
-        )
-        current_time += height
-    return "\n".join(rows)
+def experiment_engine_comparison(
+    m_values: Sequence[int],
+    n: int,
+    log_path: Path,
+    runs: int = 10,
+    *,
+    algorithms: Sequence[str] = ("NFDH", "FFDH", "BFDH", "SKYLINE"),
+) -> Dict[int, Dict[str, Tuple[float, float]]]:
+    """
+    Mean and std of epsilon per engine on the LLNL slices of experiment_llnl_stats,
+    level-based and skyline alike; printed as a table and returned by m.
+    """
+    from swf_store import SwfStore
+
+    if not log_path.exists():
+        print(f"LLNL file not found, skipping comparison: {log_path}")
+        return {}
+
+    store = SwfStore.open(log_path)
+    table: Dict[int, Dict[str, Tuple[float, float]]] = {}
+    print(f"{'m':>7} " + " ".join(f"{name + ' eps':>18}" for name in algorithms))
+    for m in m_values:
+        eps: Dict[str, List[float]] = {name: [] for name in algorithms}
+        for run_idx in range(runs):
+            tasks = store.tasks(m, offset=run_idx * m, max_width=n)
+            if len(tasks) < m:
+                break
+            for name, result in prepare(tasks, n).run(algorithms).items():
+                eps[name].append(result["epsilon"])
+        if not eps[algorithms[0]]:
+            print(f"No valid LLNL tasks for m={m}, stopping comparison.")
+            break
 
+        table[m] = {name.upper(): get_stats(values) for name, values in eps.items()}
+        print(f"{m:>7} " + " ".join(f"{mean:>10.4f} ± {std:<6.4f}" for mean, std in table[m].values()))
+    return table
+
+
+def _write_schedule(schedule: Schedule, output_format: str, output: Path | None) -> None:
+    """Stream the schedule in output_format to a file, or to stdout when output is None."""
+    writer = FORMATS[output_format]
+    binary = output_format in BINARY_FORMATS
+    if output is None:
+        if binary:
+            sys.stdout.flush()
+            writer(schedule, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            writer(schedule, sys.stdout)
+        return
 
-def run_single_instance(input_file: Path, n: int, algorithm: str) -> None:
-    tasks = parse_tasks_file(input_file)
+    if binary:
+        with output.open("wb") as file:
+            writer(schedule, file)
+    else:
+        with output.open("w", encoding="utf-8", newline="") as file:
+            writer(schedule, file)
+
+
+def _load_tasks(input_file: Path, n: int, input_format: str) -> List[Task]:
+    if input_format == "swf":
+        return list(iter_llnl_tasks(input_file, max_width=n))
+    return parse_tasks_file(input_file)
+
+
+def run_single_instance(
+    input_file: Path,
+    n: int,
+    algorithm: str,
+    input_format: str = "tasks",
+    *,
+    stats: bool = False,
+    output_format: str = "text",
+    output: Path | None = None,
+    compact: bool = False,
+) -> None:
+    """
+    Pack one file and print the summary. The schedule is streamed in
+    output_format to `output` or stdout; when stdout carries a csv/binary
+    schedule, the summary goes to stderr so stdout stays machine-readable.
+    """
+    if output_format not in FORMATS:
+        raise ValueError(f"output_format must be one of: {', '.join(FORMATS)}")
+    tasks = _load_tasks(input_file, n, input_format)
     if not tasks:
         raise ValueError("Input file has no tasks")
 
     algorithm_key = algorithm.upper()
+    if algorithm_key not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of: {', '.join(ALGORITHMS)}")
+    pack_stats = None
     t0 = time.perf_counter()
-    if algorithm_key == "NFDH":
-        schedule, t_s = nfdh(tasks, n)
-    elif algorithm_key == "FFDH":
-        schedule, t_s = ffdh(tasks, n)
+    if stats:
+        schedule, t_s, pack_stats = instrumented(algorithm_key, tasks, n)
     else:
-        raise ValueError("algorithm must be NFDH or FFDH")
+        schedule, t_s = ALGORITHMS[algorithm_key](tasks, n)
     runtime = time.perf_counter() - t0
 
+    compaction = None
+    if compact:
+        if not isinstance(schedule, Schedule):
+            raise ValueError("--compact needs a level schedule (NFDH, FFDH or BFDH)")
+        schedule, compaction = compact_schedule(schedule)
+        t_s = compaction["t_after"]
+
     t_prime = get_lower_bound(tasks, n)
     epsilon = get_epsilon(t_s, t_prime)
 
-    print(f"Algorithm: {algorithm_key}")
+    report = sys.stderr if output is None and output_format != "text" else sys.stdout
+    print(f"Algorithm: {algorithm_key}", file=report)
+    print(f"Input file: {input_file}", file=report)
+    print(f"n: {n}", file=report)
+    if output is None and output_format == "text":
+        print("S:", flush=True)
+    else:
+        print(f"S: {output or 'stdout'} ({output_format})", file=report, flush=True)
+    _write_schedule(schedule, output_format, output)
+    print(f"T(S): {t_s}", file=report)
+    print(f"T': {t_prime:.6f}", file=report)
+    print(f"epsilon: {epsilon:.6f}", file=report)
+    print(f"time_seconds: {runtime:.6f}", file=report)
+    if compaction is not None:
+        print(
+            f"compaction: T(S) {compaction['t_before']} -> {compaction['t_after']} "
+            f"(-{compaction['reduction']:.2%}), levels_removed={compaction['levels_removed']}, "
+            f"tasks_moved={compaction['tasks_moved']}, time_seconds={compaction['seconds']:.6f}",
+            file=report,
+        )
+    if pack_stats is not None:
+        print(pack_stats.report(), file=report)
+
+
+def _accumulate_area(tasks: Iterable[Task], totals: List[int]) -> Iterator[Task]:
+    """Pass tasks through while summing r_j * t_j into totals[0]."""
+    for r, t in tasks:
+        totals[0] += r * t
+        yield r, t
+
+
+def run_streaming_instance(
+    input_file: Path,
+    n: int,
+    algorithm: str,
+    input_format: str = "tasks",
+    *,
+    presorted: bool = False,
+    chunk_size: int | None = None,
+) -> None:
+    """Single mode with lazy input: memory is bounded by the open level and sort runs."""
+    algorithm_key = algorithm.upper()
+    if algorithm_key != "NFDH":
+        raise ValueError("--stream supports NFDH only")
+
+    if input_format == "swf":
+        source = iter_llnl_tasks(input_file, max_width=n)
+    else:
+        source = iter_tasks_file(input_file)
+
+    totals = [0]
+    tasks = _accumulate_area(source, totals)
+    if presorted:
+        ordered = check_sorted(tasks)
+    elif chunk_size is not None:
+        ordered = external_sort(tasks, chunk_size=chunk_size)
+    else:
+        ordered = external_sort(tasks)
+
+    print(f"Algorithm: {algorithm_key} (stream)")
     print(f"Input file: {input_file}")
     print(f"n: {n}")
     print("S:")
-    print(_format_schedule(schedule))
+    t0 = time.perf_counter()
+    t_s = 0
+    levels = 0
+    for levels, level in enumerate(stream_nfdh(ordered, n), start=1):
+        print(format_level(levels, t_s, level["height"], level["remaining"], level["tasks"]))
+        t_s += level["height"]
+    runtime = time.perf_counter() - t0
+    if levels == 0:
+        raise ValueError("Input file has no tasks")
+
+    t_prime = totals[0] / n
     print(f"T(S): {t_s}")
     print(f"T': {t_prime:.6f}")
-    print(f"epsilon: {epsilon:.6f}")
+    print(f"epsilon: {get_epsilon(t_s, t_prime):.6f}")
     print(f"time_seconds: {runtime:.6f}")
 
 
-def run_experiments() -> None:
+def run_experiments(
+    *,
+    jobs: int = 1,
+    distribution: str | None = None,
+    cache: ResultCache | None = None,
+    runs: int = 10,
+    batched: bool = False,
+) -> None:
     n = 1024
     n_values_time = [1024, 4096]
     m_values = list(range(500, 5001, 500))
     m_values_llnl = [500, 1000, 1500]
-    llnl_path = Path("data/LLNL-UBGL-2006-2.swf")
+    llnl_path = LLNL_PATH
 
     Path("data").mkdir(exist_ok=True)
     Path("graphs").mkdir(exist_ok=True)
 
-    experiment_time_complexity(m_values, n_values_time)
-    experiment_random_stats(m_values, n, runs=10)
-    experiment_llnl_stats(m_values_llnl, n, llnl_path, runs=10)
+    experiment_time_complexity(m_values, n_values_time, jobs=jobs, distribution=distribution, cache=cache)
+    experiment_memory_complexity(m_values, n_values_time, jobs=jobs, distribution=distribution)
+    experiment_random_stats(
+        m_values, n, runs=runs, jobs=jobs, distribution=distribution, cache=cache, batched=batched
+    )
+    experiment_llnl_stats(m_values_llnl, n, llnl_path, runs=10, jobs=jobs, cache=cache)
+
+    if cache is not None:
+        removed = cache.evict()
+        if removed:
+            print(f"Result cache: evicted {removed} least recently used entries")
 
     print("Done. Graphs saved to graphs/")
 
@@ -212,10 +457,100 @@ def _build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--algorithm",
         type=str,
-        choices=["NFDH", "FFDH", "nfdh", "ffdh"],
+        choices=[*ALGORITHMS, *(name.lower() for name in ALGORITHMS)],
         default="NFDH",
         help="Algorithm for --mode single.",
     )
+    parser.add_argument(
+        "--input-format",
+        choices=["tasks", "swf"],
+        default="tasks",
+        help="Format of --input-file: 'r_j t_j' lines or an SWF trace (tasks wider than n are skipped).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read --input-file lazily and print levels as they close (NFDH only).",
+    )
+    parser.add_argument(
+        "--presorted",
+        action="store_true",
+        help="With --stream: input is already sorted by t_j descending, skip the external sort.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="With --stream: tasks per in-memory sorted run of the external sort.",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=list(FORMATS),
+        default="text",
+        help="With --mode single: schedule as the text listing, CSV rows per task "
+        "(level start/end, offset, r_j, t_j) or the binary format of schedule_io.py.",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="With --mode single: write the schedule to this file instead of stdout.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="With --mode single: after packing, try to empty the shortest levels into the free "
+        "width of other levels (compaction.py) and report the makespan reduction.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="With --mode single: profile the run (phase times, tree operations, levels, "
+        "tracemalloc peak). Profiling slows the run down, time_seconds included.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for --mode experiments (0 = all cores). "
+        "Runtimes measured in parallel share the CPU with other workers.",
+    )
+    parser.add_argument(
+        "--distribution",
+        choices=DISTRIBUTION_CHOICES,
+        default=None,
+        help="Use the vectorized NumPy generator with this distribution for random experiments "
+        "(default: legacy uniform random.Random generator). 'empirical' resamples the LLNL trace.",
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=10,
+        help="Random instances per m in the random epsilon experiment.",
+    )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="Pack all runs of one m together in vectorized lockstep (batched.py); "
+        "worthwhile for hundreds of runs. Same epsilons, no result cache.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_DIRECTORY,
+        help="Directory of cached per-cell results for --mode experiments.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_BYTES / (1 << 20),
+        help="Size bound of the result cache; least recently used entries are evicted.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute every experiment cell and do not write the result cache.",
+    )
     return parser
 
 
@@ -226,10 +561,48 @@ def main() -> None:
     if args.mode == "single":
         if args.input_file is None:
             parser.error("--input-file is required for --mode single")
-        run_single_instance(args.input_file, args.n, args.algorithm)
+        if args.compact and args.algorithm.upper() == "SKYLINE":
+            parser.error("--compact works on level schedules only (not SKYLINE)")
+        if args.output_format == "binary" and args.algorithm.upper() == "SKYLINE":
+            parser.error("--output-format binary supports level schedules only (not SKYLINE)")
+        if args.stream:
+            if args.output_format != "text" or args.output is not None:
+                parser.error("--stream prints the text listing only")
+            run_streaming_instance(
+                args.input_file,
+                args.n,
+                args.algorithm,
+                args.input_format,
+                presorted=args.presorted,
+                chunk_size=args.chunk_size,
+            )
+        else:
+            run_single_instance(
+                args.input_file,
+                args.n,
+                args.algorithm,
+                args.input_format,
+                stats=args.stats,
+                output_format=args.output_format,
+                output=args.output,
+                compact=args.compact,
+            )
         return
 
-    run_experiments()
+    if args.jobs < 0:
+        parser.error("--jobs must be non-negative")
+    if args.runs <= 0:
+        parser.error("--runs must be positive")
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache_dir, max_bytes=int(args.cache_max_mb * (1 << 20)))
+    run_experiments(
+        jobs=args.jobs,
+        distribution=args.distribution,
+        cache=cache,
+        runs=args.runs,
+        batched=args.batched,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, Iterable, Sequence, Tuple
+
+from algorithms import PACKERS, _sort_by_height
+from metrics import get_epsilon
+from schedule import Schedule
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+
+class PreparedTasks:
+    """
+    A task set preprocessed once for any number of packing algorithms:
+    sorted by t_j descending (the order every packer consumes), with the
+    width check and the area lower bound T' done once.
+    """
+
+    def __init__(self, tasks: Sequence[Task], n: int) -> None:
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        t0 = time.perf_counter()
+        self.n = n
+        self.sorted_tasks, self.integral = _sort_by_height(tasks)
+        area = 0
+        for r, t in self.sorted_tasks:
+            if r > n:
+                raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
+            area += r * t
+        self.lower_bound = float(area / n) if self.sorted_tasks else 0.0
+        self.prepare_runtime = time.perf_counter() - t0
+
+    def __len__(self) -> int:
+        return len(self.sorted_tasks)
+
+    def pack(self, algorithm: str) -> Tuple[Schedule, int]:
+        """Run one registered packer on the shared sorted order."""
+        key = algorithm.upper()
+        if key not in PACKERS:
+            raise ValueError(f"Unknown algorithm {algorithm}; registered: {', '.join(PACKERS)}")
+        return PACKERS[key](self.sorted_tasks, self.n, integral=self.integral)
+
+    def run(self, algorithms: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        """
+        Pack with every algorithm and report per algorithm:
+          t_s, epsilon, pack_runtime (packing only) and
+          runtime (prepare_runtime + pack_runtime, the standalone cost).
+        """
+        results: Dict[str, Dict[str, float]] = {}
+        for algorithm in algorithms:
+            t0 = time.perf_counter()
+            _, t_s = self.pack(algorithm)
+            pack_runtime = time.perf_counter() - t0
+            results[algorithm.upper()] = {
+                "t_s": t_s,
+                "epsilon": get_epsilon(t_s, self.lower_bound),
+                "pack_runtime": pack_runtime,
+                "runtime": self.prepare_runtime + pack_runtime,
+            }
+        return results
+
+
+def prepare(tasks: Sequence[Task], n: int) -> PreparedTasks:
+    """Sort tasks and compute shared data once (see PreparedTasks)."""
+    return PreparedTasks(tasks, n)
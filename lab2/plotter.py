@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import ModuleType
 from typing import Mapping, Sequence
 
-import matplotlib.pyplot as plt
+
+def _pyplot() -> ModuleType:
+    """Import matplotlib.pyplot on first use: it costs ~0.7 s, which single mode never needs."""
+    import matplotlib.pyplot as plt
+
+    return plt
 
 
 def _ensure_graphs_dir(graphs_dir: str = "graphs") -> Path:
@@ -20,6 +26,7 @@ def plot_time_complexity(
     filename: str = "time_complexity.png",
 ) -> None:
     out_dir = _ensure_graphs_dir(graphs_dir)
+    plt = _pyplot()
     plt.figure(figsize=(9, 5))
     markers = ["o", "s", "^", "d", "x", "*"]
     for idx, (label, values) in enumerate(series.items()):
@@ -34,6 +41,42 @@ def plot_time_complexity(
     plt.close()
 
 
+def plot_memory_complexity(
+    m_values: Sequence[int],
+    peak_bytes: Mapping[str, Sequence[float]],
+    bytes_per_task: Mapping[str, Sequence[float]],
+    *,
+    graphs_dir: str = "graphs",
+    filename: str = "memory_complexity.png",
+) -> None:
+    out_dir = _ensure_graphs_dir(graphs_dir)
+    plt = _pyplot()
+    markers = ["o", "s", "^", "d", "x", "*"]
+    plt.figure(figsize=(13, 5))
+
+    plt.subplot(1, 2, 1)
+    for idx, (label, values) in enumerate(peak_bytes.items()):
+        plt.plot(m_values, [value / (1 << 20) for value in values], marker=markers[idx % len(markers)], label=label)
+    plt.xlabel("m (число задач)")
+    plt.ylabel("Пиковая память, МиБ")
+    plt.title("Сложность по памяти")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.subplot(1, 2, 2)
+    for idx, (label, values) in enumerate(bytes_per_task.items()):
+        plt.plot(m_values, values, marker=markers[idx % len(markers)], label=label)
+    plt.xlabel("m (число задач)")
+    plt.ylabel("Байт на задачу (пик)")
+    plt.title("Пиковая память на одну задачу")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.tight_layout()
+    plt.savefig(out_dir / filename, dpi=150)
+    plt.close()
+
+
 def plot_accuracy(
     m_values: Sequence[int],
     nfdh_mean: Sequence[float],
@@ -46,6 +89,7 @@ def plot_accuracy(
     title: str = "Статистика epsilon",
 ) -> None:
     out_dir = _ensure_graphs_dir(graphs_dir)
+    plt = _pyplot()
 
     plt.figure(figsize=(9, 5))
     plt.errorbar(m_values, nfdh_mean, yerr=nfdh_std, marker="o", capsize=4, label="NFDH")
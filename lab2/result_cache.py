@@ -0,0 +1,136 @@
+"""Content-addressed on-disk cache of per-cell experiment results.
+
+One small JSON file per (algorithm, m, n, seed, source, code version),
+stored under <directory>/<key[:2]>/<key>.json. Entries are written as soon
+as a cell finishes, so an interrupted sweep resumes from the cells it has
+not finished yet. Reads refresh the file mtime; `evict` drops the least
+recently used entries once the directory grows past `max_bytes`.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+DEFAULT_DIRECTORY = Path(".cache/results")
+DEFAULT_MAX_BYTES = 256 << 20
+
+# Modules whose code changes the numbers a cell produces.
+CODE_FILES = (
+    "algorithms.py",
+    "batched.py",
+    "best_fit_index.py",
+    "data_handler.py",
+    "experiment_cells.py",
+    "generators.py",
+    "metrics.py",
+    "pipeline.py",
+    "schedule.py",
+    "skyline.py",
+    "swf_parser.py",
+    "tournament_tree.py",
+)
+
+CellResult = Dict[str, float]
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """Hash of the sources listed in CODE_FILES; any edit invalidates old entries."""
+    digest = hashlib.blake2b(digest_size=16)
+    root = Path(__file__).resolve().parent
+    for name in CODE_FILES:
+        path = root / name
+        digest.update(name.encode())
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cell_key(algorithm: str, m: int, n: int, seed: int | None, source: str) -> str:
+    """Key of one cell: sha256 of its canonical description plus the code version."""
+    fields = {
+        "algorithm": algorithm.upper(),
+        "m": m,
+        "n": n,
+        "seed": seed,
+        "source": source,
+        "code": code_version(),
+    }
+    return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory of cached cell results, safe to share between worker processes:
+    each entry is written to a temp file and renamed into place.
+    """
+
+    def __init__(self, directory: str | Path = DEFAULT_DIRECTORY, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> CellResult | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        result = entry.get("result") if isinstance(entry, dict) else None
+        return result if isinstance(result, dict) else None
+
+    def put(self, key: str, result: CellResult) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{key[:8]}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump({"result": result}, file)
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries: List[Tuple[float, int, Path]] = []
+        if not self.directory.exists():
+            return entries
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of cached entries."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_bytes; returns the count removed."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink(missing_ok=True)
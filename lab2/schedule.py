@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterator, List, Tuple
+
+Task = Tuple[int, int]  # (r_j, t_j)
+Level = Dict[str, object]
+
+
+class Schedule:
+    """
+    Compact level schedule: one flat array per field instead of a dict per level.
+
+    Levels are stored in opening order (heights, remaining widths), tasks in
+    placement order (level index, horizontal offset, r_j, t_j).
+    Iterating yields the legacy {"height", "remaining", "tasks"} dicts;
+    indexing a level uses level_order, computed once and reused until tasks
+    or levels are added, so it costs O(level size) per access.
+    """
+
+    def __init__(self, n: int, *, height_code: str = "q") -> None:
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        self.n = n
+        self.heights = array(height_code)
+        self.remaining = array("q")
+        self.task_level = array("q")
+        self.task_offset = array("q")
+        self.task_width = array("q")
+        self.task_height = array(height_code)
+        self._order_key: Tuple[array, int, int] | None = None
+        self._order: Tuple[array, array] | None = None
+
+    def open_level(self, height: int) -> int:
+        """Append an empty level of given height and return its index."""
+        self.heights.append(height)
+        self.remaining.append(self.n)
+        return len(self.heights) - 1
+
+    def place(self, level: int, r: int, t: int) -> None:
+        """Place task (r, t) at the first free offset of a level."""
+        free = self.remaining[level]
+        if r > free:
+            raise ValueError(f"Task width r_j={r} exceeds free width {free} on level {level}")
+
+        self.task_level.append(level)
+        self.task_offset.append(self.n - free)
+        self.task_width.append(r)
+        self.task_height.append(t)
+        self.remaining[level] = free - r
+
+    def total_time(self) -> int:
+        """Objective T(S): sum of level heights."""
+        return sum(self.heights)
+
+    @property
+    def task_count(self) -> int:
+        return len(self.task_level)
+
+    def level_tasks(self) -> List[List[Task]]:
+        """Tasks grouped by level, in placement order within each level."""
+        grouped: List[List[Task]] = [[] for _ in range(len(self.heights))]
+        for level, r, t in zip(self.task_level, self.task_width, self.task_height):
+            grouped[level].append((r, t))
+        return grouped
+
+    def level_order(self) -> Tuple[array, array]:
+        """
+        Task indices grouped by level (placement order within a level) and
+        offsets of each level's group: level i holds order[starts[i]:starts[i + 1]].
+        Two flat arrays instead of a list per level.
+        """
+        # Stable sort keeps placement order inside a level; task_level is
+        # already ascending for NFDH and nearly so for FFDH/BFDH.
+        order = array("q", sorted(range(self.task_count), key=self.task_level.__getitem__))
+        counts = array("q", [0]) * len(self.heights)
+        for level in self.task_level:
+            counts[level] += 1
+        return order, array("q", accumulate(counts, initial=0))
+
+    def _cached_level_order(self) -> Tuple[array, array]:
+        # Keyed on the task_level array itself (compaction and loading swap
+        # it) and on both lengths, which every placement or new level grows.
+        key = (self.task_level, len(self.task_level), len(self.heights))
+        cached = self._order_key
+        if cached is None or cached[0] is not key[0] or cached[1:] != key[1:]:
+            self._order = self.level_order()
+            self._order_key = key
+        return self._order
+
+    def levels(self) -> List[Level]:
+        """Materialize the legacy list-of-dicts representation."""
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.heights)
+
+    def __iter__(self) -> Iterator[Level]:
+        for height, remaining, tasks in zip(self.heights, self.remaining, self.level_tasks()):
+            yield {"height": height, "remaining": remaining, "tasks": tasks}
+
+    def __getitem__(self, index: int) -> Level:
+        """Single level view, O(level size) once level_order is cached."""
+        if index < 0:
+            index += len(self.heights)
+        if not (0 <= index < len(self.heights)):
+            raise IndexError("level index out of range")
+
+        order, starts = self._cached_level_order()
+        widths = self.task_width
+        heights = self.task_height
+        tasks = [(widths[pos], heights[pos]) for pos in order[starts[index] : starts[index + 1]]]
+        return {"height": self.heights[index], "remaining": self.remaining[index], "tasks": tasks}
+
+    def __repr__(self) -> str:
+        return f"Schedule(n={self.n}, levels={len(self.heights)}, tasks={self.task_count})"
@@ -0,0 +1,176 @@
+"""Streaming writers and a binary format for Schedule.
+
+Every writer walks the schedule level by level from its flat arrays and
+writes as it goes, so output never needs more than one level's worth of
+Python objects or text at a time.
+
+Formats (FORMATS):
+  text   - the `--mode single` listing: one "level=..., tasks=[...]" line per level.
+  csv    - one row per task: task,level,level_start,level_end,offset,r_j,t_j.
+  binary - little-endian header and raw arrays, see write_binary / read_binary.
+
+A SkylinePlacement has no levels: text and csv then list each task with its
+first machine x and start/end times; binary export is level schedules only.
+"""
+
+from __future__ import annotations
+
+import csv
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, TextIO, Tuple
+
+from schedule import Schedule
+from skyline import SkylinePlacement
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+BINARY_MAGIC = b"LVLSCHED"
+BINARY_VERSION = 1
+# magic, version, height typecode, n, levels, tasks
+_HEADER = struct.Struct("<8sHcx4xqqq")
+CSV_HEADER = ("task", "level", "level_start", "level_end", "offset", "r_j", "t_j")
+PLACEMENT_CSV_HEADER = ("task", "x", "start", "end", "r_j", "t_j")
+
+
+def level_starts(schedule: Schedule) -> array:
+    """Start time of every level plus the makespan: L + 1 prefix sums of heights."""
+    return array(schedule.heights.typecode, accumulate(schedule.heights, initial=0))
+
+
+def iter_level_tasks(schedule: Schedule) -> Iterator[Tuple[int, List[Task]]]:
+    """(level, tasks) pairs in level order, one task list alive at a time."""
+    order, starts = schedule.level_order()
+    widths = schedule.task_width
+    heights = schedule.task_height
+    pairs = zip(map(widths.__getitem__, order), map(heights.__getitem__, order))
+    for level in range(len(schedule)):
+        yield level, list(islice(pairs, starts[level + 1] - starts[level]))
+
+
+def format_level(idx: int, start: float, height: float, remaining: int, tasks: List[Task]) -> str:
+    return (
+        f"level={idx}, start={start}, end={start + height}, "
+        f"height={height}, remaining={remaining}, tasks={tasks}"
+    )
+
+
+def write_text(schedule: Schedule | SkylinePlacement, out: TextIO) -> None:
+    """Level listing of --mode single (levels numbered from 1), written line by line."""
+    if isinstance(schedule, SkylinePlacement):
+        for task, (x, start, r, t) in enumerate(schedule, start=1):
+            out.write(f"task={task}, x={x}, start={start}, end={start + t}, r={r}, t={t}\n")
+        return
+
+    start = 0
+    heights = schedule.heights
+    remaining = schedule.remaining
+    for level, tasks in iter_level_tasks(schedule):
+        height = heights[level]
+        out.write(format_level(level + 1, start, height, remaining[level], tasks))
+        out.write("\n")
+        start += height
+
+
+def write_csv(schedule: Schedule | SkylinePlacement, out: TextIO) -> None:
+    """One row per task in placement order; task is the index in that order."""
+    writer = csv.writer(out, lineterminator="\n")
+    if isinstance(schedule, SkylinePlacement):
+        writer.writerow(PLACEMENT_CSV_HEADER)
+        for task, (x, start, r, t) in enumerate(schedule):
+            writer.writerow((task, x, start, start + t, r, t))
+        return
+
+    starts = level_starts(schedule)
+    writer.writerow(CSV_HEADER)
+    for task, (level, offset, r, t) in enumerate(
+        zip(schedule.task_level, schedule.task_offset, schedule.task_width, schedule.task_height)
+    ):
+        writer.writerow((task, level, starts[level], starts[level + 1], offset, r, t))
+
+
+def _little_endian(values: array) -> array:
+    if sys.byteorder == "little":
+        return values
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped
+
+
+def write_binary(schedule: Schedule, out: BinaryIO) -> None:
+    """
+    Header (_HEADER: magic, version, height typecode 'q' or 'd', n, L, m),
+    then little-endian arrays in this order:
+      height[L], level_start[L + 1] (height type), remaining[L] (int64),
+      task_level[m], task_offset[m], task_width[m] (int64), task_height[m] (height type).
+    Level i spans [level_start[i], level_start[i + 1]).
+    """
+    if not isinstance(schedule, Schedule):
+        raise ValueError("binary export supports level schedules only")
+    code = schedule.heights.typecode
+    out.write(
+        _HEADER.pack(
+            BINARY_MAGIC,
+            BINARY_VERSION,
+            code.encode(),
+            schedule.n,
+            len(schedule),
+            schedule.task_count,
+        )
+    )
+    for values in (
+        schedule.heights,
+        level_starts(schedule),
+        schedule.remaining,
+        schedule.task_level,
+        schedule.task_offset,
+        schedule.task_width,
+        schedule.task_height,
+    ):
+        out.write(_little_endian(values).tobytes())
+
+
+def _read_array(file: BinaryIO, code: str, count: int) -> array:
+    values = array(code)
+    values.fromfile(file, count)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def read_binary(path: str | Path) -> Schedule:
+    """Load a schedule written by write_binary."""
+    with Path(path).open("rb") as file:
+        header = file.read(_HEADER.size)
+        if len(header) != _HEADER.size:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, code, n, levels, tasks = _HEADER.unpack(header)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError(f"{path}: not a version {BINARY_VERSION} schedule file")
+        code = code.decode()
+        if code not in ("q", "d"):
+            raise ValueError(f"{path}: unknown height type {code!r}")
+
+        try:
+            schedule = Schedule(n, height_code=code)
+            schedule.heights = _read_array(file, code, levels)
+            _read_array(file, code, levels + 1)  # level_start, derived from heights
+            schedule.remaining = _read_array(file, "q", levels)
+            schedule.task_level = _read_array(file, "q", tasks)
+            schedule.task_offset = _read_array(file, "q", tasks)
+            schedule.task_width = _read_array(file, "q", tasks)
+            schedule.task_height = _read_array(file, code, tasks)
+        except EOFError:
+            raise ValueError(f"{path}: truncated data") from None
+    return schedule
+
+
+FORMATS: Dict[str, Callable[..., None]] = {
+    "text": write_text,
+    "csv": write_csv,
+    "binary": write_binary,
+}
+BINARY_FORMATS = ("binary",)
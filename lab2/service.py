@@ -0,0 +1,402 @@
+"""Long-running strip packing service on a local socket (JSON lines).
+
+Usage:
+  python service.py                                  # unix socket .cache/packing.sock
+  python service.py --port 8765                      # TCP on 127.0.0.1
+  python service.py --max-batch 64 --batch-window-ms 2 --max-pending 1024
+
+Every request is one JSON object per line:
+  {"id": 7, "n": 1024, "algorithm": "FFDH", "tasks": [[r_j, t_j], ...], "schedule": true}
+and gets one line back (responses of a connection may come out of order,
+match them by id):
+  {"id": 7, "ok": true, "algorithm": "FFDH", "t_s": ..., "lower_bound": ...,
+   "epsilon": ..., "levels": [{"start", "height", "remaining", "tasks"}, ...]}
+  {"id": 7, "ok": false, "error": "..."}
+SKYLINE returns "placements" ([x, start, r_j, t_j] per task) instead of
+"levels"; "schedule": false returns the numbers only.
+
+Requests from all connections go to one bounded queue. A batcher takes
+whatever is queued (after waiting up to batch_window for more) and packs
+the micro-batch in a worker thread, so the event loop keeps reading and
+answering. Equal-shape NFDH/FFDH requests without a schedule are packed
+together by batched.py. Backpressure: a full queue answers "busy" at
+once, a connection stops being read while it has max_inflight requests
+outstanding, and lines longer than max_line_bytes close the connection.
+Requests with n > max_n, non-finite numbers or n * sum(t_j) > 2^62 are
+rejected, a request that fails while packing fails only itself, and
+responses are strict JSON (no NaN/Infinity).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from algorithms import ALGORITHMS
+from metrics import get_epsilon, get_lower_bound
+from schedule_io import iter_level_tasks, level_starts
+from skyline import SkylinePlacement
+
+Task = Tuple[int, int]  # (r_j, t_j)
+Request = Dict[str, Any]
+Response = Dict[str, Any]
+
+DEFAULT_SOCKET = Path(".cache/packing.sock")
+DEFAULT_MAX_PENDING = 1024
+DEFAULT_MAX_BATCH = 64
+DEFAULT_BATCH_WINDOW = 0.002  # seconds
+DEFAULT_MAX_INFLIGHT = 64  # per connection
+DEFAULT_MAX_LINE_BYTES = 64 << 20
+DEFAULT_MAX_N = 1 << 20  # machine count cap: BFDH/SKYLINE work grows with n in the shared worker
+MAX_TOTAL_WORK = 1 << 62  # n * sum(t_j) bound: sums, areas and T(S) stay within int64
+BATCHED_MIN_GROUP = 8  # equal-shape requests packed by batched.py from this size on
+
+
+def parse_request(message: Dict[str, Any], *, max_n: int = DEFAULT_MAX_N) -> Request:
+    """Validate one decoded request; raises ValueError with a message for the client."""
+    if not isinstance(message, dict):
+        raise ValueError("request must be a JSON object")
+    n = message.get("n")
+    if not isinstance(n, int) or isinstance(n, bool) or n <= 0:
+        raise ValueError("n must be a positive integer")
+    if n > max_n:
+        raise ValueError(f"n={n} exceeds the service limit max_n={max_n}")
+    algorithm = str(message.get("algorithm", "NFDH")).upper()
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm must be one of: {', '.join(ALGORITHMS)}")
+    raw_tasks = message.get("tasks")
+    if not isinstance(raw_tasks, list) or not raw_tasks:
+        raise ValueError("tasks must be a non-empty list of [r_j, t_j] pairs")
+
+    max_t = MAX_TOTAL_WORK // max_n
+    tasks: List[Task] = []
+    total = 0
+    for item in raw_tasks:
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            raise ValueError("tasks must be a non-empty list of [r_j, t_j] pairs")
+        r, t = item
+        if not isinstance(r, int) or isinstance(r, bool) or not 0 < r <= n:
+            raise ValueError(f"task width r_j={r!r} must be an integer in [1, n={n}]")
+        if not isinstance(t, (int, float)) or isinstance(t, bool) or not math.isfinite(t) or t < 0:
+            raise ValueError(f"task time t_j={t!r} must be a finite non-negative number")
+        if t > max_t:
+            raise ValueError(f"task time t_j={t!r} exceeds the service limit {max_t}")
+        total += t
+        tasks.append((r, t))
+    if n * total > MAX_TOTAL_WORK:
+        raise ValueError(f"total work n * sum(t_j) exceeds the service limit {MAX_TOTAL_WORK}")
+    return {
+        "id": message.get("id"),
+        "n": n,
+        "algorithm": algorithm,
+        "tasks": tasks,
+        "schedule": bool(message.get("schedule", True)),
+    }
+
+
+def _schedule_fields(schedule: Any) -> Dict[str, Any]:
+    if isinstance(schedule, SkylinePlacement):
+        return {"placements": [list(placement) for placement in schedule]}
+    starts = level_starts(schedule)
+    return {
+        "levels": [
+            {
+                "start": starts[level],
+                "height": schedule.heights[level],
+                "remaining": schedule.remaining[level],
+                "tasks": tasks,
+            }
+            for level, tasks in iter_level_tasks(schedule)
+        ]
+    }
+
+
+def solve(request: Request) -> Response:
+    """Pack one validated request."""
+    tasks = request["tasks"]
+    n = request["n"]
+    schedule, t_s = ALGORITHMS[request["algorithm"]](tasks, n)
+    lower_bound = get_lower_bound(tasks, n)
+    response: Response = {
+        "id": request["id"],
+        "ok": True,
+        "algorithm": request["algorithm"],
+        "t_s": t_s,
+        "lower_bound": lower_bound,
+        "epsilon": get_epsilon(t_s, lower_bound),
+    }
+    if request["schedule"]:
+        response.update(_schedule_fields(schedule))
+    return response
+
+
+def _solve_group(requests: Sequence[Request]) -> List[Response]:
+    """Equal (algorithm, n, m) requests without schedules in one batched.py call."""
+    from batched import pack_batch, stack_instances
+
+    head = requests[0]
+    widths, heights = stack_instances([request["tasks"] for request in requests])
+    makespans, epsilons = pack_batch(widths, heights, head["n"], head["algorithm"])
+    lower_bounds = (widths * heights).sum(axis=1) / head["n"]
+    return [
+        {
+            "id": request["id"],
+            "ok": True,
+            "algorithm": request["algorithm"],
+            "t_s": t_s,
+            "lower_bound": lower_bound,
+            "epsilon": epsilon,
+        }
+        for request, t_s, lower_bound, epsilon in zip(
+            requests, makespans.tolist(), lower_bounds.tolist(), epsilons.tolist()
+        )
+    ]
+
+
+def solve_batch(requests: Sequence[Request]) -> List[Response]:
+    """
+    Pack a micro-batch; responses in request order, errors reported per request.
+    A batched.py group that fails is retried request by request.
+    """
+    responses: List[Response | None] = [None] * len(requests)
+    groups: Dict[Tuple[str, int, int], List[int]] = defaultdict(list)
+    for pos, request in enumerate(requests):
+        if not request["schedule"] and request["algorithm"] in ("NFDH", "FFDH") and all(
+            isinstance(t, int) for _, t in request["tasks"]
+        ):
+            groups[(request["algorithm"], request["n"], len(request["tasks"]))].append(pos)
+
+    for positions in groups.values():
+        if len(positions) >= BATCHED_MIN_GROUP:
+            try:
+                group = _solve_group([requests[pos] for pos in positions])
+            except Exception:  # e.g. int64 overflow: solve the members one by one below
+                continue
+            for pos, response in zip(positions, group):
+                responses[pos] = response
+
+    for pos, request in enumerate(requests):
+        if responses[pos] is not None:
+            continue
+        try:
+            responses[pos] = solve(request)
+        except ValueError as exc:
+            responses[pos] = {"id": request["id"], "ok": False, "error": str(exc)}
+        except Exception as exc:  # one bad request must not fail the rest of the batch
+            responses[pos] = {"id": request["id"], "ok": False, "error": f"internal error: {exc}"}
+    return responses  # type: ignore[return-value]
+
+
+class PackingService:
+    """Socket front end, bounded request queue and micro-batcher (see module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_inflight: int = DEFAULT_MAX_INFLIGHT,
+        max_line_bytes: int = DEFAULT_MAX_LINE_BYTES,
+        max_n: int = DEFAULT_MAX_N,
+    ) -> None:
+        if min(max_pending, max_batch, max_inflight, max_line_bytes, max_n) <= 0:
+            raise ValueError("service limits must be positive")
+        if batch_window < 0:
+            raise ValueError("batch_window must be non-negative")
+
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_inflight = max_inflight
+        self.max_line_bytes = max_line_bytes
+        self.max_n = max_n
+        self.stats = {"requests": 0, "rejected": 0, "batches": 0, "largest_batch": 0}
+        self._queue: asyncio.Queue | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="packer")
+
+    async def _batcher(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            if self.batch_window and queue.qsize() < self.max_batch - 1:
+                await asyncio.sleep(self.batch_window)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            requests = [request for request, _ in batch]
+            try:
+                responses = await loop.run_in_executor(self._executor, solve_batch, requests)
+            except Exception as exc:  # keep serving; report to every waiter
+                responses = [{"id": request["id"], "ok": False, "error": f"internal error: {exc}"} for request in requests]
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+            self.stats["batches"] += 1
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+
+    async def _answer(
+        self,
+        future: asyncio.Future,
+        writer: asyncio.StreamWriter,
+        lock: asyncio.Lock,
+        slots: asyncio.Semaphore,
+    ) -> None:
+        try:
+            response = await future
+            await self._send(writer, lock, response)
+        finally:
+            slots.release()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, lock: asyncio.Lock, response: Response) -> None:
+        async with lock:
+            if writer.is_closing():
+                return
+            writer.write(_encode(response))
+            await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        lock = asyncio.Lock()
+        slots = asyncio.Semaphore(self.max_inflight)
+        answers: set = set()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await slots.acquire()  # stop reading this client while it has too much in flight
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    slots.release()
+                    await self._send(writer, lock, {"id": None, "ok": False, "error": "request line too long"})
+                    break
+                if not line:
+                    slots.release()
+                    break
+                if not line.strip():
+                    slots.release()
+                    continue
+
+                self.stats["requests"] += 1
+                try:
+                    request = parse_request(json.loads(line), max_n=self.max_n)
+                except ValueError as exc:  # json.JSONDecodeError included
+                    slots.release()
+                    await self._send(writer, lock, {"id": _request_id(line), "ok": False, "error": str(exc)})
+                    continue
+
+                future = loop.create_future()
+                try:
+                    self._queue.put_nowait((request, future))
+                except asyncio.QueueFull:
+                    slots.release()
+                    self.stats["rejected"] += 1
+                    await self._send(writer, lock, {"id": request["id"], "ok": False, "error": "busy"})
+                    continue
+                task = asyncio.create_task(self._answer(future, writer, lock, slots))
+                answers.add(task)
+                task.add_done_callback(answers.discard)
+            if answers:
+                await asyncio.gather(*answers, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, *, socket_path: Path | None = None, host: str = "127.0.0.1", port: int | None = None) -> None:
+        """Serve forever on a unix socket (default) or on host:port."""
+        self._queue = asyncio.Queue(self.max_pending)
+        batcher = asyncio.create_task(self._batcher())
+        if port is not None:
+            server = await asyncio.start_server(self._handle, host, port, limit=self.max_line_bytes)
+            where = f"{host}:{port}"
+        else:
+            socket_path = Path(socket_path or DEFAULT_SOCKET)
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if socket_path.exists():
+                socket_path.unlink()
+            server = await asyncio.start_unix_server(self._handle, str(socket_path), limit=self.max_line_bytes)
+            where = str(socket_path)
+        print(
+            f"packing service on {where}: algorithms {', '.join(ALGORITHMS)}, max_pending={self.max_pending}, "
+            f"max_batch={self.max_batch}, batch_window={self.batch_window * 1000:.1f} ms",
+            flush=True,
+        )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            self._executor.shutdown(wait=False)
+
+
+def _encode(response: Response) -> bytes:
+    """Strict JSON line; a response that is not valid JSON becomes an error reply."""
+    try:
+        text = json.dumps(response, separators=(",", ":"), allow_nan=False)
+    except ValueError as exc:
+        text = json.dumps(
+            {"id": response.get("id"), "ok": False, "error": f"unserializable result: {exc}"}, separators=(",", ":")
+        )
+    return text.encode() + b"\n"
+
+
+def _request_id(line: bytes) -> Any:
+    """Best-effort id of a request that failed validation."""
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return None
+    return message.get("id") if isinstance(message, dict) else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Strip packing service: JSON lines on a local socket.")
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET, help="Unix socket path.")
+    parser.add_argument("--port", type=int, default=None, help="Listen on 127.0.0.1:PORT instead of a unix socket.")
+    parser.add_argument("--max-pending", type=int, default=DEFAULT_MAX_PENDING, help="Queued requests before 'busy'.")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="Requests per micro-batch.")
+    parser.add_argument(
+        "--batch-window-ms",
+        type=float,
+        default=DEFAULT_BATCH_WINDOW * 1000,
+        help="How long the batcher waits for more requests after the first one.",
+    )
+    parser.add_argument("--max-inflight", type=int, default=DEFAULT_MAX_INFLIGHT, help="Outstanding requests per connection.")
+    parser.add_argument("--max-n", type=int, default=DEFAULT_MAX_N, help="Largest machine count n accepted.")
+    args = parser.parse_args()
+
+    try:
+        service = PackingService(
+            max_pending=args.max_pending,
+            max_batch=args.max_batch,
+            batch_window=args.batch_window_ms / 1000,
+            max_inflight=args.max_inflight,
+            max_n=args.max_n,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    started = time.perf_counter()
+    try:
+        asyncio.run(service.serve(socket_path=args.socket, port=args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = service.stats
+        print(
+            f"served {stats['requests']} requests in {stats['batches']} batches "
+            f"(largest {stats['largest_batch']}, rejected {stats['rejected']}) "
+            f"over {time.perf_counter() - started:.1f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Discrete-event replay of an SWF trace on an n-processor machine.
+
+Usage:
+  python simulator.py data/LLNL-UBGL-2006-2.swf --n 1024
+  python simulator.py trace.swf --n 1024 --policy NFDH --no-backfill --limit 100000
+
+Jobs arrive at their SWF submit times (column 2) and wait in a queue.
+Whenever the machine is free, the waiting jobs form one level, as the
+first shelf of NFDH or FFDH would: jobs are taken by t_j descending, either
+until the first one that does not fit (NFDH) or every one that still fits
+(FFDH). The level ends when its tallest job does; the next level needs the
+whole machine at that moment, which is the reservation of EASY
+backfilling: while a level runs, a waiting job may start on idle
+processors if it finishes by the level end. Run times are taken as exact
+estimates (the column store has no requested-time column).
+
+The queue is a TournamentTree over all jobs ranked by (t_j descending,
+arrival), leaf value n - r_j while a job waits and -1 otherwise, so level
+formation and backfill candidates are First-Fit queries in O(log N).
+Finish and level-end events go through a heap; arrivals are merged from
+the submit-sorted trace.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from tournament_tree import TournamentTree
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+POLICIES = ("NFDH", "FFDH")
+BSLD_THRESHOLD = 10  # seconds, bounded slowdown max((wait + run) / max(run, 10), 1)
+_FINISH = 0  # event kinds; at equal times finishes pop before the level end
+_LEVEL_END = 1
+
+
+def simulate(
+    submit: Sequence[int],
+    width: Sequence[int],
+    runtime: Sequence[int],
+    n: int,
+    *,
+    policy: str = "FFDH",
+    backfill: bool = True,
+) -> Dict[str, float]:
+    """
+    Replay jobs (submit time, r_j, t_j) on n processors.
+
+    Jobs wider than n are skipped. Returns a report: jobs, skipped, levels,
+    backfilled, makespan (first submit to last finish), utilization,
+    mean_wait, mean_bounded_slowdown, events, seconds, events_per_second.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+    policy = policy.upper()
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown policy {policy}; available: {', '.join(POLICIES)}")
+    if not (len(submit) == len(width) == len(runtime)):
+        raise ValueError("submit, width and runtime must have the same length")
+
+    t0 = time.perf_counter()
+    jobs = sorted(
+        (s, r, t) for s, r, t in zip(submit, width, runtime) if r <= n
+    )  # by submit time; ties by width then runtime, deterministic
+    skipped = len(submit) - len(jobs)
+    count = len(jobs)
+    if count == 0:
+        raise ValueError(f"No jobs with r_j <= n={n}")
+
+    arrive = [s for s, _, _ in jobs]
+    widths = [r for _, r, _ in jobs]
+    runtimes = [t for _, _, t in jobs]
+    by_height = sorted(range(count), key=lambda job: -runtimes[job])
+    rank = [0] * count
+    for pos, job in enumerate(by_height):
+        rank[job] = pos
+    neg_height = [-runtimes[job] for job in by_height]  # ascending, for bisect
+
+    queue = TournamentTree(count)
+    query = queue.query
+    query_from = queue.query_from
+    update = queue.update
+    start_time = [0] * count
+    events: List[Tuple[int, int, int]] = []  # (time, kind, job or -1)
+    push = heapq.heappush
+    pop = heapq.heappop
+
+    now = arrive[0]
+    free = n
+    level_end = -1  # -1: machine idle, no level running
+    levels = 0
+    backfilled = 0
+    processed = 0
+    waiting = 0
+    nxt = 0
+
+    def start(job: int) -> None:
+        nonlocal free, waiting
+        update(rank[job], -1)
+        waiting -= 1
+        free -= widths[job]
+        start_time[job] = now
+        push(events, (now + runtimes[job], _FINISH, job))
+
+    def open_level() -> None:
+        nonlocal level_end, levels
+        first = by_height[query(0)]  # tallest waiting job, always fits
+        start(first)
+        level_end = now + runtimes[first]
+        push(events, (level_end, _LEVEL_END, -1))
+        levels += 1
+        if policy == "NFDH":
+            while waiting:
+                job = by_height[query(0)]
+                if widths[job] > free:
+                    break
+                start(job)
+        else:
+            while waiting and free:
+                pos = query(n - free)
+                if pos == -1:
+                    break
+                start(by_height[pos])
+
+    def fill_backfill() -> None:
+        nonlocal backfilled
+        if not backfill:
+            return
+        while waiting and free:
+            first = bisect_left(neg_height, now - level_end)  # t_j <= level_end - now
+            pos = query_from(n - free, first)
+            if pos == -1:
+                return
+            start(by_height[pos])
+            backfilled += 1
+
+    while nxt < count or events:
+        # All events of one instant are applied before any scheduling decision.
+        now = events[0][0] if events else arrive[nxt]
+        if nxt < count and arrive[nxt] < now:
+            now = arrive[nxt]
+        while events and events[0][0] == now and events[0][1] == _FINISH:
+            free += widths[pop(events)[2]]
+            processed += 1
+        while nxt < count and arrive[nxt] == now:
+            update(rank[nxt], n - widths[nxt])
+            waiting += 1
+            nxt += 1
+            processed += 1
+        if events and events[0][0] == now:  # the level end
+            pop(events)
+            processed += 1
+            level_end = -1
+
+        if level_end == -1 and waiting:
+            open_level()
+        if level_end != -1 and now < level_end:
+            fill_backfill()
+
+    end = max(start_time[job] + runtimes[job] for job in range(count))
+    span = end - arrive[0]
+    area = sum(r * t for r, t in zip(widths, runtimes))
+    wait_sum = 0
+    bsld_sum = 0.0
+    for job in range(count):
+        wait = start_time[job] - arrive[job]
+        run = runtimes[job]
+        wait_sum += wait
+        bsld_sum += max((wait + run) / max(run, BSLD_THRESHOLD), 1.0)
+    seconds = time.perf_counter() - t0
+    return {
+        "jobs": count,
+        "skipped": skipped,
+        "levels": levels,
+        "backfilled": backfilled,
+        "makespan": span,
+        "utilization": area / (n * span) if span > 0 else 0.0,
+        "mean_wait": wait_sum / count,
+        "mean_bounded_slowdown": bsld_sum / count,
+        "events": processed,
+        "seconds": seconds,
+        "events_per_second": processed / seconds if seconds > 0 else 0.0,
+    }
+
+
+def replay_trace(
+    path: str | Path,
+    n: int,
+    *,
+    policy: str = "FFDH",
+    backfill: bool = True,
+    limit: int | None = None,
+) -> Dict[str, float]:
+    """Replay the first `limit` valid jobs (all by default) of an SWF trace via its column store."""
+    from swf_store import SwfStore
+
+    t0 = time.perf_counter()
+    store = SwfStore.open(path)
+    stop = len(store) if limit is None else min(limit, len(store))
+    submit = store.submit[:stop].tolist()
+    width = store.width[:stop].tolist()
+    runtime = store.runtime[:stop].tolist()
+    load_seconds = time.perf_counter() - t0
+
+    keep = [pos for pos, value in enumerate(submit) if value >= 0]  # -1: unknown submit time
+    report = simulate(
+        [submit[pos] for pos in keep],
+        [width[pos] for pos in keep],
+        [runtime[pos] for pos in keep],
+        n,
+        policy=policy,
+        backfill=backfill,
+    )
+    report["skipped"] += stop - len(keep)
+    report["load_seconds"] = load_seconds
+    return report
+
+
+def format_report(report: Dict[str, float]) -> List[str]:
+    return [
+        f"jobs={report['jobs']}, skipped={report['skipped']}, levels={report['levels']}, "
+        f"backfilled={report['backfilled']}",
+        f"makespan={report['makespan']} s ({report['makespan'] / 86400:.1f} days), "
+        f"utilization={report['utilization']:.4f}",
+        f"mean_wait={report['mean_wait']:.1f} s, "
+        f"mean_bounded_slowdown={report['mean_bounded_slowdown']:.2f}",
+        f"events={report['events']}, simulate_seconds={report['seconds']:.2f}, "
+        f"events_per_second={report['events_per_second']:.0f}",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay an SWF trace with level formation and backfilling.")
+    parser.add_argument("trace", type=Path, help="SWF trace file.")
+    parser.add_argument("--n", type=int, default=1024, help="Processor count; wider jobs are skipped.")
+    parser.add_argument("--policy", type=str.upper, choices=POLICIES, default="FFDH")
+    parser.add_argument("--no-backfill", action="store_true", help="Start jobs only at level boundaries.")
+    parser.add_argument("--limit", type=int, default=None, help="Replay only the first LIMIT valid jobs.")
+    args = parser.parse_args()
+    if args.n <= 0:
+        parser.error("--n must be positive")
+    if args.limit is not None and args.limit <= 0:
+        parser.error("--limit must be positive")
+
+    report = replay_trace(
+        args.trace,
+        args.n,
+        policy=args.policy,
+        backfill=not args.no_backfill,
+        limit=args.limit,
+    )
+    print(f"{args.trace} n={args.n} policy={args.policy} backfill={not args.no_backfill}")
+    print(f"load_seconds={report['load_seconds']:.2f}")
+    for line in format_report(report):
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from typing import Iterator, List, Tuple
+
+Task = Tuple[int, int]  # (r_j, t_j)
+Placement = Tuple[int, float, int, float]  # (x, start, r_j, t_j)
+
+
+class Skyline:
+    """
+    Upper contour of a bottom-left packing: maximal segments (x, width, y)
+    covering [0, n), kept in a doubly linked list over flat arrays.
+    Adjacent segments always have different y. The lowest segment (leftmost
+    on ties) comes from a heap whose stale entries are skipped lazily.
+    """
+
+    def __init__(self, n: int, *, height_code: str = "q") -> None:
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        self.n = n
+        self.seg_x = array("q", [0])
+        self.seg_w = array("q", [n])
+        self.seg_y = array(height_code, [0])
+        self.prev = array("q", [-1])
+        self.next = array("q", [-1])
+        self.alive = bytearray([1])
+        self._heap: List[Tuple[float, int, int]] = [(0, 0, 0)]  # (y, x, segment)
+
+    def _new(self, x: int, width: int, y: float, prev: int, nxt: int) -> int:
+        seg = len(self.seg_x)
+        self.seg_x.append(x)
+        self.seg_w.append(width)
+        self.seg_y.append(y)
+        self.prev.append(prev)
+        self.next.append(nxt)
+        self.alive.append(1)
+        heapq.heappush(self._heap, (y, x, seg))
+        return seg
+
+    def _push(self, seg: int) -> None:
+        heapq.heappush(self._heap, (self.seg_y[seg], self.seg_x[seg], seg))
+
+    def lowest(self) -> int:
+        """Segment with the smallest y, leftmost among equals."""
+        heap = self._heap
+        while True:
+            y, x, seg = heap[0]
+            if self.alive[seg] and self.seg_y[seg] == y and self.seg_x[seg] == x:
+                return seg
+            heapq.heappop(heap)
+
+    def _absorb_next(self, seg: int) -> None:
+        """Merge the right neighbour into seg (same y)."""
+        right = self.next[seg]
+        self.seg_w[seg] += self.seg_w[right]
+        self.alive[right] = 0
+        after = self.next[right]
+        self.next[seg] = after
+        if after != -1:
+            self.prev[after] = seg
+
+    def place(self, seg: int, r: int, t: float) -> Tuple[int, float]:
+        """Put a task of width r at the left end of segment seg; returns (x, start)."""
+        x = self.seg_x[seg]
+        y = self.seg_y[seg]
+        width = self.seg_w[seg]
+        if r > width:
+            raise ValueError(f"Task width r_j={r} exceeds gap width {width}")
+
+        if r < width:
+            right = self.next[seg]
+            rest = self._new(x + r, width - r, y, seg, right)
+            if right != -1:
+                self.prev[right] = rest
+            self.next[seg] = rest
+            self.seg_w[seg] = r
+        self.seg_y[seg] = y + t
+
+        left = self.prev[seg]
+        if left != -1 and self.seg_y[left] == self.seg_y[seg]:
+            self._absorb_next(left)
+            seg = left
+        right = self.next[seg]
+        if right != -1 and self.seg_y[right] == self.seg_y[seg]:
+            self._absorb_next(seg)
+        self._push(seg)
+        return x, y
+
+    def raise_gap(self, seg: int) -> None:
+        """No task fits: lift seg to its lower neighbour and merge with it (wasted area)."""
+        left = self.prev[seg]
+        right = self.next[seg]
+        if left == -1 and right == -1:
+            raise ValueError("Gap spans the whole strip; nothing to merge with")
+
+        if right == -1 or (left != -1 and self.seg_y[left] <= self.seg_y[right]):
+            target = self.seg_y[left]
+        else:
+            target = self.seg_y[right]
+        self.seg_y[seg] = target
+        if left != -1 and self.seg_y[left] == target:
+            self._absorb_next(left)
+            seg = left
+        right = self.next[seg]
+        if right != -1 and self.seg_y[right] == target:
+            self._absorb_next(seg)
+        self._push(seg)
+
+
+class SkylinePlacement:
+    """
+    Non-shelf packing: every task has its own start time, so there are no
+    levels. Columns in placement order: x (first machine), start, r_j, t_j.
+    """
+
+    def __init__(self, n: int, *, height_code: str = "q") -> None:
+        if n <= 0:
+            raise ValueError("n must be positive")
+
+        self.n = n
+        self.task_x = array("q")
+        self.task_start = array(height_code)
+        self.task_width = array("q")
+        self.task_height = array(height_code)
+
+    @property
+    def task_count(self) -> int:
+        return len(self.task_x)
+
+    def total_time(self) -> float:
+        """Objective T(S): latest finish time."""
+        return max((start + t for start, t in zip(self.task_start, self.task_height)), default=0)
+
+    def __len__(self) -> int:
+        return len(self.task_x)
+
+    def __iter__(self) -> Iterator[Placement]:
+        return zip(self.task_x, self.task_start, self.task_width, self.task_height)
+
+    def __repr__(self) -> str:
+        return f"SkylinePlacement(n={self.n}, tasks={self.task_count})"
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import heapq
+import os
+import tempfile
+from array import array
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, List, Tuple
+
+from algorithms import sort_tasks
+from schedule import Level
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+DEFAULT_CHUNK_SIZE = 1_000_000  # tasks held in memory per sorted run
+_READ_BLOCK = 1 << 16  # tasks read back from a run file at once
+
+
+def _spill_run(run: List[Task], tmp_dir: str | None) -> BinaryIO:
+    """Write a sorted run as interleaved int64 (r_j, t_j) pairs to a temp file."""
+    flat = array("q")
+    for r, t in run:
+        flat.append(r)
+        flat.append(t)
+    file = tempfile.TemporaryFile(dir=tmp_dir)
+    flat.tofile(file)
+    file.seek(0)
+    return file
+
+
+def _read_run(file: BinaryIO) -> Iterator[Task]:
+    try:
+        while True:
+            block = array("q")
+            try:
+                block.fromfile(file, 2 * _READ_BLOCK)
+            except EOFError:
+                pass
+            if not block:
+                return
+            yield from zip(block[0::2], block[1::2])
+    finally:
+        file.close()
+
+
+def external_sort(
+    tasks: Iterable[Task],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    tmp_dir: str | os.PathLike | None = None,
+) -> Iterator[Task]:
+    """
+    Yield tasks sorted by t_j descending (stable) using bounded memory.
+    Input is cut into sorted runs of chunk_size tasks; runs beyond the first
+    are spilled to temporary files and merged lazily. t_j must be integers.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    source = iter(tasks)
+    runs: List[BinaryIO] = []
+    tmp = None if tmp_dir is None else str(Path(tmp_dir))
+    while True:
+        run = sort_tasks(list(islice(source, chunk_size)))
+        if not run:
+            break
+        if not runs and len(run) < chunk_size:
+            # Whole input fits in one run: no spilling needed.
+            yield from run
+            return
+        runs.append(_spill_run(run, tmp))
+        del run
+
+    yield from heapq.merge(*(_read_run(file) for file in runs), key=itemgetter(1), reverse=True)
+
+
+def check_sorted(tasks: Iterable[Task]) -> Iterator[Task]:
+    """Pass tasks through, raising ValueError if t_j ever increases."""
+    previous = None
+    for position, (r, t) in enumerate(tasks):
+        if previous is not None and t > previous:
+            raise ValueError(f"Input is not sorted by t_j descending at task {position}: {t} > {previous}")
+        previous = t
+        yield r, t
+
+
+def stream_nfdh(sorted_tasks: Iterable[Task], n: int) -> Iterator[Level]:
+    """
+    Next Fit Decreasing Height over an already sorted task stream.
+    Yields each level as soon as it closes; only the open level is kept.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    level: Level | None = None
+    remaining = -1
+    for r, t in sorted_tasks:
+        if r > n:
+            raise ValueError(f"Task width r_j={r} exceeds machine capacity n={n}")
+
+        if remaining < r:
+            if level is not None:
+                level["remaining"] = remaining
+                yield level
+            level = {"height": t, "remaining": n, "tasks": []}
+            remaining = n
+
+        level["tasks"].append((r, t))
+        remaining -= r
+
+    if level is not None:
+        level["remaining"] = remaining
+        yield level
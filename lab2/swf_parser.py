@@ -0,0 +1,270 @@
+"""Block-wise NumPy parser for SWF traces.
+
+Same selection rules as data_handler.parse_swf_line, but the file is
+memory-mapped and cut into blocks of whole lines. Each block goes through
+NumPy's C tokenizer (np.loadtxt on the four used columns) and the
+requested/allocated fallback and filtering are applied on arrays. Blocks
+that the C reader rejects (ragged or malformed lines) are parsed line by
+line with the Python parser.
+
+Compressed traces (.gz, .xz, .bz2) are decompressed as a stream and cut
+into the same kind of blocks. Blocks can be parsed in a process pool
+(jobs > 1); results are concatenated in file order, so every selection
+(offset, max_width) is the same as with the sequential parser.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+import warnings
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, Callable, Deque, Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+import numpy as np
+
+from data_handler import COMPRESSED_SUFFIXES, open_trace, parse_swf_line
+
+Task = Tuple[int, int]  # (r_j, t_j)
+T = TypeVar("T")
+
+BLOCK_SIZE = 16 << 20
+COLUMNS = ("row", "submit", "width", "runtime")
+_USECOLS = (1, 3, 4, 7)  # submit, run time, allocated, requested processors
+_SKIP_HEAD = np.zeros(256, dtype=bool)  # first bytes of lines that hold no job
+_SKIP_HEAD[[ord(";"), ord("\n"), ord("\r")]] = True
+
+
+def _empty_columns() -> Dict[str, np.ndarray]:
+    return {name: np.empty(0, dtype=np.int64) for name in COLUMNS}
+
+
+def _slow_lines(block: bytes, starts: np.ndarray, ends: np.ndarray, lines: np.ndarray) -> Dict[str, np.ndarray]:
+    """Parse selected lines of a block with the reference Python parser."""
+    rows: List[int] = []
+    submits: List[int] = []
+    widths: List[int] = []
+    runtimes: List[int] = []
+    for line in lines.tolist():
+        text = block[starts[line] : ends[line]].decode("utf-8", errors="ignore")
+        job = parse_swf_line(text)
+        if job is None:
+            continue
+        rows.append(line)
+        submits.append(job[0])
+        widths.append(job[1])
+        runtimes.append(job[2])
+    return {
+        "row": np.array(rows, dtype=np.int64),
+        "submit": np.array(submits, dtype=np.int64),
+        "width": np.array(widths, dtype=np.int64),
+        "runtime": np.array(runtimes, dtype=np.int64),
+    }
+
+
+def _to_int(values: np.ndarray) -> np.ndarray:
+    """int(float(x)) semantics: truncate toward zero."""
+    return np.trunc(values).astype(np.int64)
+
+
+def _parse_block(block: bytes) -> Dict[str, np.ndarray]:
+    """Valid jobs of a block of whole lines; "row" is the 0-based line index in the block."""
+    data = np.frombuffer(block, dtype=np.uint8)
+    newlines = np.flatnonzero(data == ord("\n"))
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [len(data)]))
+    if starts[-1] == len(data):
+        starts, ends = starts[:-1], ends[:-1]
+    if len(starts) == 0:
+        return _empty_columns()
+
+    # Lines np.loadtxt will return a row for: not empty, not a ';' comment.
+    data_lines = np.flatnonzero(~_SKIP_HEAD[data[starts]])
+    if len(data_lines) == 0:
+        return _empty_columns()
+
+    try:
+        with warnings.catch_warnings():
+            # Blocks of indented comments only: loadtxt warns and returns no rows.
+            warnings.simplefilter("ignore", UserWarning)
+            table = np.loadtxt(io.BytesIO(block), comments=";", usecols=_USECOLS, dtype=np.float64, ndmin=2)
+    except ValueError:
+        table = None
+    if table is None or len(table) != len(data_lines):
+        return _slow_lines(block, starts, ends, data_lines)
+
+    submit_f, runtime_f, alloc_f, req_f = table.T
+    ok = np.isfinite(runtime_f) & np.isfinite(alloc_f) & np.isfinite(req_f)
+    runtime = _to_int(np.where(ok, runtime_f, 0.0))
+    req = _to_int(np.where(ok, req_f, 0.0))
+    proc = np.where(req > 0, req, _to_int(np.where(ok, alloc_f, 0.0)))
+    ok &= (proc > 0) & (runtime > 0)
+    submit = np.where(np.isfinite(submit_f), submit_f, -1.0)[ok]
+    return {
+        "row": data_lines[ok].astype(np.int64),
+        "submit": _to_int(submit),
+        "width": proc[ok],
+        "runtime": runtime[ok],
+    }
+
+
+def _line_ranges(mm: mmap.mmap, block_size: int) -> Iterator[Tuple[int, int]]:
+    """[start, end) byte ranges of about block_size bytes, cut after a newline."""
+    size = len(mm)
+    pos = 0
+    while pos < size:
+        end = min(pos + block_size, size)
+        if end < size:
+            cut = mm.rfind(b"\n", pos, end)
+            if cut == -1:
+                cut = mm.find(b"\n", end)
+            end = size if cut == -1 else cut + 1
+        yield pos, end
+        pos = end
+
+
+def _stream_blocks(file: BinaryIO, block_size: int) -> Iterator[bytes]:
+    """Blocks of whole lines from a (decompressing) stream that cannot be mapped."""
+    tail = b""
+    while True:
+        data = file.read(block_size)
+        if not data:
+            break
+        data = tail + data
+        cut = data.rfind(b"\n")
+        if cut == -1:
+            tail = data
+            continue
+        tail = data[cut + 1 :]
+        yield data[: cut + 1]
+    if tail:
+        yield tail
+
+
+def _parse_chunk(block: bytes) -> Tuple[Dict[str, np.ndarray], int]:
+    """Parsed columns of a block and its newline count (to number rows of later blocks)."""
+    return _parse_block(block), block.count(b"\n")
+
+
+def _parse_range(path: str, start: int, end: int) -> Tuple[Dict[str, np.ndarray], int]:
+    """Worker side of a plain file: map the file and parse one line-aligned range."""
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _parse_chunk(mm[start:end])
+
+
+def _ordered_map(pool: Executor, func: Callable[..., T], items: Iterable[tuple], window: int) -> Iterator[T]:
+    """pool.map that keeps at most `window` tasks in flight, so input is consumed lazily."""
+    pending: Deque[Future] = deque()
+    for args in items:
+        pending.append(pool.submit(func, *args))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _iter_chunks(path: Path, block_size: int, jobs: int) -> Iterator[Tuple[Dict[str, np.ndarray], int]]:
+    if path.suffix.lower() in COMPRESSED_SUFFIXES:
+        with open_trace(path, binary=True) as file:
+            if jobs == 1:
+                yield from map(_parse_chunk, _stream_blocks(file, block_size))
+                return
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                blocks = ((block,) for block in _stream_blocks(file, block_size))
+                yield from _ordered_map(pool, _parse_chunk, blocks, 2 * jobs)
+        return
+
+    if path.stat().st_size == 0:
+        return
+    with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if jobs == 1:
+            for start, end in _line_ranges(mm, block_size):
+                yield _parse_chunk(mm[start:end])
+            return
+        ranges = list(_line_ranges(mm, block_size))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from _ordered_map(pool, _parse_range, ((str(path), start, end) for start, end in ranges), 2 * jobs)
+
+
+def iter_swf_blocks(
+    filepath: str | Path,
+    *,
+    block_size: int = BLOCK_SIZE,
+    jobs: int = 1,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Yield column dicts of valid jobs block by block, in file order.
+    "row" holds 1-based line numbers in the file, like data_handler.iter_swf_jobs.
+
+    .gz/.xz/.bz2 traces are decompressed on the fly. With jobs > 1 (0 = all
+    cores) blocks are parsed in a process pool: workers map their own byte
+    range of a plain file, compressed blocks are sent to them; results are
+    yielded in file order either way.
+    """
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    if jobs < 0:
+        raise ValueError("jobs must be non-negative")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    lines_before = 0
+    for columns, lines in _iter_chunks(path, block_size, jobs):
+        columns["row"] += lines_before + 1
+        lines_before += lines
+        yield columns
+
+
+def read_swf_columns(
+    filepath: str | Path,
+    *,
+    block_size: int = BLOCK_SIZE,
+    jobs: int = 1,
+) -> Dict[str, np.ndarray]:
+    """All valid jobs of an SWF trace as int64 columns: row, submit, width, runtime."""
+    blocks = list(iter_swf_blocks(filepath, block_size=block_size, jobs=jobs))
+    if not blocks:
+        return _empty_columns()
+    return {name: np.concatenate([block[name] for block in blocks]) for name in COLUMNS}
+
+
+def parse_llnl_logs_fast(
+    filepath: str | Path,
+    m: int,
+    *,
+    offset: int = 0,
+    max_width: int | None = None,
+    block_size: int = BLOCK_SIZE,
+    jobs: int = 1,
+) -> List[Task]:
+    """
+    Drop-in for data_handler.parse_llnl_logs; stops reading once enough tasks
+    are found (with jobs > 1, up to 2 * jobs blocks are parsed ahead).
+    """
+    if m <= 0:
+        return []
+    if offset < 0:
+        raise ValueError("offset must be non-negative")
+
+    widths: List[np.ndarray] = []
+    runtimes: List[np.ndarray] = []
+    found = 0
+    for block in iter_swf_blocks(filepath, block_size=block_size, jobs=jobs):
+        keep = slice(None) if max_width is None else block["width"] <= max_width
+        widths.append(block["width"][keep])
+        runtimes.append(block["runtime"][keep])
+        found += len(widths[-1])
+        if found >= offset + m:
+            break
+
+    if not widths:
+        return []
+    width = np.concatenate(widths)[offset : offset + m]
+    runtime = np.concatenate(runtimes)[offset : offset + m]
+    return list(zip(width.tolist(), runtime.tolist()))
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from swf_parser import read_swf_columns
+
+Task = Tuple[int, int]  # (r_j, t_j)
+
+STORE_VERSION = 1
+STORE_SUFFIX = ".cols"
+COLUMNS = ("width", "runtime", "submit", "row")
+_SAMPLE_BYTES = 1 << 20  # head and tail bytes hashed into the fingerprint
+
+
+def _fingerprint(source: Path) -> Dict[str, object]:
+    """Cheap identity of a source file: size, mtime and a hash of its head and tail."""
+    stat = source.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with source.open("rb") as file:
+        digest.update(file.read(_SAMPLE_BYTES))
+        if stat.st_size > 2 * _SAMPLE_BYTES:
+            file.seek(-_SAMPLE_BYTES, os.SEEK_END)
+            digest.update(file.read(_SAMPLE_BYTES))
+    return {
+        "version": STORE_VERSION,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sample_hash": digest.hexdigest(),
+    }
+
+
+def store_path(source: str | Path) -> Path:
+    """Cache directory of a source trace: stored next to it as <name>.cols/."""
+    source = Path(source)
+    return source.with_name(source.name + STORE_SUFFIX)
+
+
+def build_store(source: str | Path, *, jobs: int = 1) -> Path:
+    """Parse an SWF trace (plain or .gz/.xz/.bz2) once and write its valid jobs as .npy columns."""
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"File not found: {source}")
+
+    target = store_path(source)
+    meta = _fingerprint(source)
+    columns = read_swf_columns(source, jobs=jobs)
+    meta["jobs"] = int(len(columns["width"]))
+    meta["max_width"] = int(columns["width"].max()) if meta["jobs"] else 0
+
+    # Build in a sibling temp dir and rename, so readers never see half a store.
+    tmp = Path(tempfile.mkdtemp(prefix=target.name + ".", dir=target.parent))
+    try:
+        for name, values in columns.items():
+            np.save(tmp / f"{name}.npy", values)
+        (tmp / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        if target.exists():
+            shutil.rmtree(target)
+        os.replace(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not _is_fresh(target, source):
+            raise
+    return target
+
+
+def _is_fresh(target: Path, source: Path) -> bool:
+    meta_file = target / "meta.json"
+    if not meta_file.exists():
+        return False
+    try:
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+
+    current = _fingerprint(source)
+    return all(meta.get(key) == value for key, value in current.items())
+
+
+class SwfStore:
+    """
+    Memory-mapped column store of the valid jobs of one SWF trace.
+
+    Columns (int64, one entry per valid job, in file order):
+      width (r_j after the requested/allocated fallback), runtime (t_j),
+      submit (submit time), row (1-based line number in the source).
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        self.meta = json.loads((self.directory / "meta.json").read_text(encoding="utf-8"))
+        self.width = np.load(self.directory / "width.npy", mmap_mode="r")
+        self.runtime = np.load(self.directory / "runtime.npy", mmap_mode="r")
+        self.submit = np.load(self.directory / "submit.npy", mmap_mode="r")
+        self.row = np.load(self.directory / "row.npy", mmap_mode="r")
+        self._filtered: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, source: str | Path, *, rebuild: bool = False, jobs: int = 1) -> "SwfStore":
+        """Open the store of a trace, (re)building it with `jobs` parser processes if missing or stale."""
+        source = Path(source)
+        if not source.exists():
+            raise FileNotFoundError(f"File not found: {source}")
+
+        target = store_path(source)
+        if rebuild or not _is_fresh(target, source):
+            build_store(source, jobs=jobs)
+        return cls(target)
+
+    def __len__(self) -> int:
+        return int(self.meta["jobs"])
+
+    def _index(self, max_width: int) -> np.ndarray:
+        """Positions of jobs with r_j <= max_width, computed once and kept on disk."""
+        index = self._filtered.get(max_width)
+        if index is not None:
+            return index
+
+        path = self.directory / f"index_w{max_width}.npy"
+        if path.exists():
+            index = np.load(path, mmap_mode="r")
+        else:
+            index = np.flatnonzero(self.width <= max_width).astype(np.int64)
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+            np.save(tmp, index)
+            os.replace(tmp, path)
+        self._filtered[max_width] = index
+        return index
+
+    def slice(
+        self,
+        m: int,
+        *,
+        offset: int = 0,
+        max_width: int | None = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Widths and runtimes of valid jobs [offset, offset + m), same selection
+        as parse_llnl_logs. Zero-copy views unless max_width filters jobs out,
+        in which case m rows are gathered through the filtered index.
+        """
+        if m <= 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        if offset < 0:
+            raise ValueError("offset must be non-negative")
+
+        if max_width is None or max_width >= int(self.meta["max_width"]):
+            return self.width[offset : offset + m], self.runtime[offset : offset + m]
+
+        positions = self._index(max_width)[offset : offset + m]
+        return self.width[positions], self.runtime[positions]
+
+    def tasks(self, m: int, *, offset: int = 0, max_width: int | None = None) -> List[Task]:
+        """Same result as parse_llnl_logs(source, m, offset=..., max_width=...)."""
+        widths, runtimes = self.slice(m, offset=offset, max_width=max_width)
+        return list(zip(widths.tolist(), runtimes.tolist()))
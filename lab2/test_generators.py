@@ -0,0 +1,9 @@
+from generators import generate_tasks
+
+
+def test_pareto_reaches_minimum_width_and_scale():
+    tasks = generate_tasks(10_000, 64, seed=0, distribution="pareto")
+    widths = [r for r, _ in tasks]
+    durations = [t for _, t in tasks]
+    assert min(widths) == 1 and max(widths) <= 64
+    assert min(durations) == 10  # floor(scale) with the default scale=10
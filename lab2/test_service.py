@@ -0,0 +1,29 @@
+import pytest
+
+from service import BATCHED_MIN_GROUP, MAX_TOTAL_WORK, parse_request, solve_batch
+
+
+def _request(request_id, tasks, n=16, algorithm="FFDH"):
+    return {"id": request_id, "n": n, "algorithm": algorithm, "tasks": tasks, "schedule": False}
+
+
+def test_parse_request_rejects_huge_t():
+    with pytest.raises(ValueError, match="service limit"):
+        parse_request({"n": 16, "tasks": [[1, 2**70]]})
+    with pytest.raises(ValueError, match="total work"):
+        parse_request({"n": 4, "tasks": [[1, MAX_TOTAL_WORK // 4 // 2]] * 3}, max_n=4)
+
+
+def test_poison_request_fails_alone():
+    good = [[3, 5], [8, 2], [5, 7], [16, 1]]
+    requests = [_request(i, good) for i in range(BATCHED_MIN_GROUP + 2)]
+    requests.insert(4, _request("poison", [[3, 2**70], [8, 2], [5, 7], [16, 1]]))
+
+    responses = solve_batch(requests)
+
+    assert [response["id"] for response in responses] == [request["id"] for request in requests]
+    for response in responses:
+        if response["id"] == "poison":
+            assert not response["ok"]
+        else:
+            assert response["ok"] and response["t_s"] == responses[0]["t_s"]
@@ -1,29 +1,84 @@
 from __future__ import annotations
 
+from array import array
+from typing import Iterable, List, Tuple
+
+_FREE = -1  # leaf value of an unused slot: fits no task
+
 
 class TournamentTree:
-    """Segment tree over free widths for First-Fit queries."""
+    """
+    Segment tree over free widths for First-Fit queries.
+
+    Backed by one flat array('q'). Starts with `size` slots and doubles its
+    capacity on `append`, so it never has to be sized for the worst case.
+    """
 
-    def __init__(self, size: int) -> None:
-        if size <= 0:
-            raise ValueError("size must be positive")
+    def __init__(self, size: int = 0) -> None:
+        if size < 0:
+            raise ValueError("size must be non-negative")
 
         self.size = size
         self.base = 1
         while self.base < size:
             self.base *= 2
-        self.tree = [-1] * (2 * self.base)
+        self.tree = array("q", [_FREE]) * (2 * self.base)
+
+    @classmethod
+    def from_values(cls, values: Iterable[int]) -> "TournamentTree":
+        """Build a tree over initial free widths in O(L)."""
+        leaves = array("q", values)
+        tree = cls(len(leaves))
+        tree.tree[tree.base : tree.base + len(leaves)] = leaves
+        tree._rebuild()
+        return tree
+
+    def _rebuild(self) -> None:
+        tree = self.tree
+        for pos in range(self.base - 1, 0, -1):
+            left = tree[2 * pos]
+            right = tree[2 * pos + 1]
+            tree[pos] = left if left > right else right
+
+    def _grow(self) -> None:
+        old_base = self.base
+        leaves = self.tree[old_base : old_base + self.size]
+        self.base = old_base * 2
+        self.tree = array("q", [_FREE]) * (2 * self.base)
+        self.tree[self.base : self.base + self.size] = leaves
+        self._rebuild()
+
+    def append(self, value: int) -> int:
+        """Add a level with given free width and return its index."""
+        if self.size == self.base:
+            self._grow()
+        index = self.size
+        self.size += 1
+        self.update(index, value)
+        return index
+
+    def value(self, index: int) -> int:
+        """Free width stored for a level."""
+        if not (0 <= index < self.size):
+            raise IndexError("index out of range")
+        return self.tree[self.base + index]
 
     def update(self, index: int, value: int) -> None:
         """Update free width on a level."""
         if not (0 <= index < self.size):
             raise IndexError("index out of range")
 
+        tree = self.tree
         pos = self.base + index
-        self.tree[pos] = value
+        tree[pos] = value
         pos //= 2
         while pos > 0:
-            self.tree[pos] = max(self.tree[2 * pos], self.tree[2 * pos + 1])
+            left = tree[2 * pos]
+            right = tree[2 * pos + 1]
+            best = left if left > right else right
+            if tree[pos] == best:
+                break
+            tree[pos] = best
             pos //= 2
 
     def query(self, required_width: int) -> int:
@@ -31,14 +86,58 @@ class TournamentTree:
         Return first level index with free width >= required_width.
         Returns -1 if no suitable level exists.
         """
-        if self.tree[1] < required_width:
+        tree = self.tree
+        if tree[1] < required_width:
             return -1
 
         pos = 1
-        while pos < self.base:
-            left = 2 * pos
-            if self.tree[left] >= required_width:
-                pos = left
-            else:
-                pos = left + 1
-        return pos - self.base
+        base = self.base
+        while pos < base:
+            pos *= 2
+            if tree[pos] < required_width:
+                pos += 1
+        return pos - base
+
+    def query_from(self, required_width: int, start: int) -> int:
+        """
+        Return first level index >= start with free width >= required_width.
+        Returns -1 if no suitable level exists.
+        """
+        if start >= self.size:
+            return -1
+        tree = self.tree
+        base = self.base
+        pos = base + max(start, 0)
+        # Climb to the first subtree right of the path that can hold the width.
+        while tree[pos] < required_width:
+            while pos & 1:
+                pos //= 2
+            if pos == 0:
+                return -1
+            pos += 1
+        while pos < base:
+            pos *= 2
+            if tree[pos] < required_width:
+                pos += 1
+        return pos - base
+
+    def fill(self, required_width: int, count: int) -> Tuple[List[Tuple[int, int]], int]:
+        """
+        Answer `count` consecutive First-Fit queries for equal widths in one pass.
+
+        Equivalent to repeating query + update(free - required_width), but each
+        touched level is updated once. Returns ([(index, tasks_placed), ...], unplaced).
+        """
+        placed: List[Tuple[int, int]] = []
+        tree = self.tree
+        base = self.base
+        while count > 0:
+            idx = self.query(required_width)
+            if idx == -1:
+                break
+            free = tree[base + idx]
+            k = count if required_width <= 0 else min(count, free // required_width)
+            self.update(idx, free - k * required_width)
+            placed.append((idx, k))
+            count -= k
+        return placed, count
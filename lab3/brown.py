@@ -20,17 +20,32 @@ beta - alpha is the residual convergence gap of the iterative process.
 import numpy as np
 
 
-def brown_method(C: np.ndarray, epsilon: float) -> dict:
-    """Run Brown's iterative method on payment matrix C.
+ENGINES = ("fast", "reference")
 
-    Returns a dict with keys:
-      iterations            — total loop iteration count (= l2 = col_counts.sum())
-      approx_game_value     — midpoint (alpha + beta) / 2
-      convergence_gap       — residual gap (beta - alpha) at convergence
-      strategy_vc           — optimal mixed strategy for Player 1 (VC), shape (n+1,)
-      strategy_dp           — optimal mixed strategy for Player 2 (Dispatcher), shape (n+1,)
-    """
-    n = C.shape[0]
+
+def _accessors(C):
+    """(size, row, col) for a dense ndarray or an implicit matrix with row(i)/col(j)."""
+    if isinstance(C, np.ndarray):
+        return C.shape[0], (lambda i: C[i, :]), (lambda j: C[:, j])
+    return C.shape[0], C.row, C.col
+
+
+def _fast_accessors(C):
+    """Like _accessors, but dense columns come from a transposed C-contiguous copy."""
+    if isinstance(C, np.ndarray):
+        C = np.ascontiguousarray(C)
+        CT = np.ascontiguousarray(C.T)  # CT[j] is column j, read sequentially
+        return C.shape[0], C.__getitem__, CT.__getitem__
+    return C.shape[0], C.row, C.col
+
+
+def _due(l2: int, check_every: int, max_iterations) -> bool:
+    return l2 % check_every == 0 or (max_iterations is not None and l2 >= max_iterations)
+
+
+def _run_reference(C, epsilon, check_every, max_iterations):
+    """Original loop: strided column reads, separate min/max passes."""
+    n, row, col = _accessors(C)
 
     row_counts = np.zeros(n, dtype=np.int64)
     col_counts = np.zeros(n, dtype=np.int64)
@@ -43,7 +58,7 @@ def brown_method(C: np.ndarray, epsilon: float) -> dict:
     # Player 1 makes the initial move (arbitrary: row 0)
     i_cur = 0
     row_counts[i_cur] += 1
-    row_score += C[i_cur, :]
+    row_score += row(i_cur)
     l1 = 1
     l2 = 0
 
@@ -51,21 +66,102 @@ def brown_method(C: np.ndarray, epsilon: float) -> dict:
         # Player 2 (minimizer): pick column that minimises cumulative row score
         j_cur = int(np.argmin(row_score))
         col_counts[j_cur] += 1
-        col_score += C[:, j_cur]
+        col_score += col(j_cur)
         l2 += 1
 
         # Player 1 (maximizer): pick row that maximises cumulative column score
         i_cur = int(np.argmax(col_score))
         row_counts[i_cur] += 1
-        row_score += C[i_cur, :]
+        row_score += row(i_cur)
         l1 += 1
 
+        if not _due(l2, check_every, max_iterations):
+            continue
         # Separate denominators: Player 1 made l1 moves, Player 2 made l2 moves
         alpha = np.min(row_score) / l1   # lower bound on game value
         beta = np.max(col_score) / l2    # upper bound on game value
 
         if beta - alpha < epsilon:
-            break
+            return row_counts, col_counts, l2, alpha, beta, True
+        if max_iterations is not None and l2 >= max_iterations:
+            return row_counts, col_counts, l2, alpha, beta, False
+
+
+def _run_fast(C, epsilon, check_every, max_iterations):
+    """Same moves as _run_reference with one argmin and one argmax per iteration.
+
+    max(col_score) is col_score at the argmax just taken, and min(row_score)
+    after the row update is row_score at the argmin that picks the next
+    column, so alpha and beta need no extra passes over the scores.
+    """
+    n, row, col = _fast_accessors(C)
+
+    row_counts = np.zeros(n, dtype=np.int64)
+    col_counts = np.zeros(n, dtype=np.int64)
+    row_score = np.zeros(n)
+    col_score = np.zeros(n)
+
+    row_counts[0] += 1
+    row_score += row(0)
+    l1 = 1
+    l2 = 0
+    j_cur = int(row_score.argmin())
+
+    while True:
+        col_counts[j_cur] += 1
+        col_score += col(j_cur)
+        l2 += 1
+
+        i_cur = int(col_score.argmax())
+        beta_sum = col_score[i_cur]
+        row_counts[i_cur] += 1
+        row_score += row(i_cur)
+        l1 += 1
+
+        j_cur = int(row_score.argmin())  # next column and the current min
+        if not _due(l2, check_every, max_iterations):
+            continue
+        alpha = row_score[j_cur] / l1
+        beta = beta_sum / l2
+
+        if beta - alpha < epsilon:
+            return row_counts, col_counts, l2, alpha, beta, True
+        if max_iterations is not None and l2 >= max_iterations:
+            return row_counts, col_counts, l2, alpha, beta, False
+
+
+def brown_method(C, epsilon: float, *, engine: str = "fast", check_every: int = 1,
+                 max_iterations=None) -> dict:
+    """Run Brown's iterative method on payment matrix C.
+
+    C is either a dense np.ndarray or an implicit matrix such as
+    matrix.PaymentMatrix that produces rows and columns on demand.
+
+    engine        — "fast" (transposed contiguous copy for dense column reads,
+                    fused argmin/min and argmax/max) or "reference" (original
+                    loop); both make the same moves and give the same result.
+    check_every   — test beta - alpha < epsilon every k iterations (1 = every
+                    iteration, as before); may overshoot convergence by k - 1.
+    max_iterations — stop after this many iterations even if not converged
+                    (None = no limit).
+
+    Returns a dict with keys:
+      iterations            — total loop iteration count (= l2 = col_counts.sum())
+      approx_game_value     — midpoint (alpha + beta) / 2
+      convergence_gap       — residual gap (beta - alpha) at convergence
+      strategy_vc           — optimal mixed strategy for Player 1 (VC), shape (n+1,)
+      strategy_dp           — optimal mixed strategy for Player 2 (Dispatcher), shape (n+1,)
+      converged             — False if max_iterations stopped the loop first
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of: {', '.join(ENGINES)}")
+    if check_every < 1:
+        raise ValueError("check_every must be >= 1")
+    if max_iterations is not None and max_iterations < 1:
+        raise ValueError("max_iterations must be >= 1")
+
+    run = _run_fast if engine == "fast" else _run_reference
+    row_counts, col_counts, l2, alpha, beta, converged = run(C, epsilon, check_every, max_iterations)
 
     convergence_gap = beta - alpha
     approx_game_value = (alpha + beta) / 2
@@ -81,4 +177,5 @@ def brown_method(C: np.ndarray, epsilon: float) -> dict:
         "strategy_dp": strategy_dp,
         "alpha": alpha,
         "beta": beta,
+        "converged": converged,
     }
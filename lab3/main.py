@@ -4,6 +4,8 @@ Usage:
   python main.py -n 10 -c1 1 -c2 4 -c3 5 -e 0.01
   python main.py --input input.txt
   python main.py --input input.txt -e 0.01
+  python main.py -n 200 -c1 1 -c2 4 -c3 5 -e 0.5 --implicit
+  python main.py -n 2000 -c1 1 -c2 4 -c3 5 -e 0.1 --check-every 16 --max-iterations 100000
 
 Input file format (one value per line):
   n
@@ -21,8 +23,8 @@ Constraints:
 import argparse
 import sys
 
-from matrix import build_payment_matrix, print_matrix
-from brown import brown_method
+from matrix import PaymentMatrix, build_payment_matrix, print_matrix
+from brown import ENGINES, brown_method
 
 
 def parse_args():
@@ -33,6 +35,14 @@ def parse_args():
     parser.add_argument("-c2", type=float, default=None, help="Cost c2")
     parser.add_argument("-c3", type=float, default=None, help="Cost c3")
     parser.add_argument("-e", "--epsilon", type=float, default=0.01, help="Convergence threshold (default 0.01)")
+    parser.add_argument("--implicit", action="store_true",
+                        help="Do not materialize C: rows/columns are computed on demand (large n)")
+    parser.add_argument("--engine", choices=ENGINES, default="fast",
+                        help="Brown iteration engine (default fast; reference is the original loop)")
+    parser.add_argument("--check-every", type=int, default=1,
+                        help="Check beta - alpha < epsilon every k iterations (default 1)")
+    parser.add_argument("--max-iterations", type=int, default=None,
+                        help="Stop after this many iterations even if not converged")
     return parser.parse_args()
 
 
@@ -72,14 +82,23 @@ def main():
 
     epsilon = args.epsilon
     validate(n, c1, c2, c3)
+    if args.check_every < 1:
+        sys.exit("--check-every must be >= 1")
+    if args.max_iterations is not None and args.max_iterations < 1:
+        sys.exit("--max-iterations must be >= 1")
 
     print(f"n = {n},  c1 = {c1},  c2 = {c2},  c3 = {c3},  ε = {epsilon}\n")
 
-    C = build_payment_matrix(n, c1, c2, c3)
-    print("Payment matrix C:")
-    print_matrix(C)
+    if args.implicit:
+        C = PaymentMatrix(n, c1, c2, c3)
+        print(f"Payment matrix C: implicit {C.shape[0]}x{C.shape[1]} (not printed)")
+    else:
+        C = build_payment_matrix(n, c1, c2, c3)
+        print("Payment matrix C:")
+        print_matrix(C)
 
-    result = brown_method(C, epsilon)
+    result = brown_method(C, epsilon, engine=args.engine, check_every=args.check_every,
+                          max_iterations=args.max_iterations)
 
     strat_vc = result["strategy_vc"]
     strat_dp = result["strategy_dp"]
@@ -89,6 +108,8 @@ def main():
     convergence_gap = result["convergence_gap"]
 
     print(f"\nNumber of iterations l = {result['iterations']}")
+    if not result["converged"]:
+        print(f"Warning: stopped by --max-iterations before beta - alpha < {epsilon}")
     print(f"Approximate game value V ≈ {approx_value:.3f}")
     print(f"Convergence gap β−α = {convergence_gap:.3f}  "
           f"(bounds: {alpha:.3f} <= V <= {beta:.3f})")
@@ -6,22 +6,63 @@ The Dispatcher assigns i tasks to the system (strategy j, 0..n).
 Cost formula derived from the model [Evreinov, Khoroshevsky, p.187]:
   c[i][j] = c2*(i-j) + c1*j  if i >= j  (i machines active, j tasks: j run at c1 each, i-j idle at c2 each)
   c[i][j] = c3*(j-i) + c2*i  if i < j   (i machines active, j tasks: i run at c2 each, j-i wait at c3 each)
+
+build_payment_matrix materializes C; PaymentMatrix gives the same rows and
+columns on demand for n too large to store C (brown_method accepts both).
 """
 
 import numpy as np
 
 
 def build_payment_matrix(n: int, c1: float, c2: float, c3: float) -> np.ndarray:
-    """Build (n+1)x(n+1) payment matrix for the Dispatcher-VC game."""
+    """Build (n+1)x(n+1) payment matrix for the Dispatcher-VC game (broadcast, no Python loops)."""
     size = n + 1
-    C = np.zeros((size, size))
-    for i in range(size):
-        for j in range(size):
-            if i >= j:
-                C[i][j] = c2 * (i - j) + c1 * j
-            else:
-                C[i][j] = c3 * (j - i) + c2 * i
-    return C
+    i = np.arange(size, dtype=np.float64)[:, None]
+    j = np.arange(size, dtype=np.float64)[None, :]
+    return np.where(i >= j, c2 * (i - j) + c1 * j, c3 * (j - i) + c2 * i)
+
+
+class PaymentMatrix:
+    """Implicit piecewise-linear Dispatcher-VC matrix: rows and columns on demand.
+
+    Holds only n, c1, c2, c3 and an index vector, O(n) memory instead of
+    O(n^2). row(i) is C[i, :] and col(j) is C[:, j], both computed by the
+    same formula as build_payment_matrix, so values match it exactly.
+    """
+
+    def __init__(self, n: int, c1: float, c2: float, c3: float):
+        if n < 0:
+            raise ValueError("n must be >= 0")
+        self.n = n
+        self.c1 = c1
+        self.c2 = c2
+        self.c3 = c3
+        self._index = np.arange(n + 1, dtype=np.float64)
+
+    @property
+    def shape(self) -> tuple:
+        return (self.n + 1, self.n + 1)
+
+    def _check(self, k: int) -> float:
+        if not 0 <= k <= self.n:
+            raise IndexError(f"index {k} out of range 0..{self.n}")
+        return float(k)
+
+    def row(self, i: int) -> np.ndarray:
+        """C[i, :] — payments of VC strategy i against every Dispatcher strategy j."""
+        i = self._check(i)
+        j = self._index
+        return np.where(i >= j, self.c2 * (i - j) + self.c1 * j, self.c3 * (j - i) + self.c2 * i)
+
+    def col(self, j: int) -> np.ndarray:
+        """C[:, j] — payments of every VC strategy i against Dispatcher strategy j."""
+        j = self._check(j)
+        i = self._index
+        return np.where(i >= j, self.c2 * (i - j) + self.c1 * j, self.c3 * (j - i) + self.c2 * i)
+
+    def to_dense(self) -> np.ndarray:
+        """Materialize the full matrix (same as build_payment_matrix)."""
+        return build_payment_matrix(self.n, self.c1, self.c2, self.c3)
 
 
 def print_matrix(C: np.ndarray) -> None: